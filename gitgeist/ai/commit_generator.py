@@ -4,7 +4,8 @@ import asyncio
 import json
 import subprocess
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from gitgeist.ai.llm_client import OllamaClient
 from gitgeist.ai.prompts import COMMIT_PROMPTS
@@ -22,13 +23,18 @@ logger = get_logger(__name__)
 class CommitGenerator:
     """Generates intelligent commit messages using semantic analysis"""
 
-    def __init__(self, config: GitgeistConfig):
+    def __init__(self, config: GitgeistConfig, cwd: Optional[Path] = None):
         self.config = config
+        # Explicit repository root; None keeps the old "wherever the
+        # process happens to be" behavior for single-repo usage
+        self.cwd = Path(cwd) if cwd else None
         self.llm_client = OllamaClient(config)
-        self.memory = GitgeistMemory(config.data_dir)
+        # Anchor a relative data_dir to the repo instead of the process cwd
+        data_dir = self.cwd / config.data_dir if self.cwd else config.data_dir
+        self.memory = GitgeistMemory(data_dir)
         self.planner = GitgeistPlanner(self.memory)
         self.templates = CommitTemplateManager()
-        self.branch_manager = BranchManager()
+        self.branch_manager = BranchManager(cwd=self.cwd)
         self.analyzer = OptimizedAnalyzer()
 
     def _analyze_git_status(self) -> Dict:
@@ -40,68 +46,118 @@ class CommitGenerator:
                 capture_output=True,
                 text=True,
                 check=True,
+                cwd=self.cwd,
             )
+            return self._parse_status(result.stdout)
 
-            files = {"staged": [], "modified": [], "added": [], "deleted": []}
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Git status failed: {e}")
+            return {"error": str(e)}
 
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
+    @staticmethod
+    def _parse_status(output: str) -> Dict:
+        """Parse `git status --porcelain` output into file buckets"""
+        files = {"staged": [], "modified": [], "added": [], "deleted": []}
 
-                index_status = line[0]
-                work_status = line[1]
-                filepath = line[3:]
+        for line in output.strip().split("\n"):
+            if not line:
+                continue
 
-                if index_status != " ":  # Staged changes
-                    files["staged"].append(filepath)
-                elif work_status == "M":
-                    files["modified"].append(filepath)
-                elif work_status == "?":
-                    files["added"].append(filepath)
-                elif work_status == "D":
-                    files["deleted"].append(filepath)
+            index_status = line[0]
+            work_status = line[1]
+            filepath = line[3:]
 
-            return files
+            if index_status != " ":  # Staged changes
+                files["staged"].append(filepath)
+            elif work_status == "M":
+                files["modified"].append(filepath)
+            elif work_status == "?":
+                files["added"].append(filepath)
+            elif work_status == "D":
+                files["deleted"].append(filepath)
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Git status failed: {e}")
-            return {"error": str(e)}
+        return files
 
     def _get_diff_stats(self) -> Dict:
         """Get detailed diff statistics"""
         try:
             result = subprocess.run(
-                ["git", "diff", "--stat"], capture_output=True, text=True, check=True
+                ["git", "diff", "--stat"],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=self.cwd,
             )
-
-            lines = result.stdout.strip().split("\n")
-            stats = {"files_changed": 0, "insertions": 0, "deletions": 0, "files": []}
-
-            for line in lines:
-                if " file" in line and "changed" in line:
-                    # Parse summary line: "X files changed, Y insertions(+), Z deletions(-)"
-                    parts = line.split(",")
-                    stats["files_changed"] = int(parts[0].split()[0])
-
-                    for part in parts[1:]:
-                        if "insertion" in part:
-                            stats["insertions"] = int(part.strip().split()[0])
-                        elif "deletion" in part:
-                            stats["deletions"] = int(part.strip().split()[0])
-                elif "|" in line:
-                    # Parse file-specific stats: "filename | 5 ++---"
-                    parts = line.split("|")
-                    if len(parts) == 2:
-                        filename = parts[0].strip()
-                        changes = parts[1].strip()
-                        stats["files"].append({"name": filename, "changes": changes})
-
-            return stats
+            return self._parse_diff_stats(result.stdout)
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Git diff failed: {e}")
             return {"error": str(e)}
 
+    @staticmethod
+    def _parse_diff_stats(output: str) -> Dict:
+        """Parse `git diff --stat` output into change counts"""
+        stats = {"files_changed": 0, "insertions": 0, "deletions": 0, "files": []}
+
+        for line in output.strip().split("\n"):
+            if " file" in line and "changed" in line:
+                # Parse summary line: "X files changed, Y insertions(+), Z deletions(-)"
+                parts = line.split(",")
+                stats["files_changed"] = int(parts[0].split()[0])
+
+                for part in parts[1:]:
+                    if "insertion" in part:
+                        stats["insertions"] = int(part.strip().split()[0])
+                    elif "deletion" in part:
+                        stats["deletions"] = int(part.strip().split()[0])
+            elif "|" in line:
+                # Parse file-specific stats: "filename | 5 ++---"
+                parts = line.split("|")
+                if len(parts) == 2:
+                    filename = parts[0].strip()
+                    changes = parts[1].strip()
+                    stats["files"].append({"name": filename, "changes": changes})
+
+        return stats
+
+    def _snapshot_git_state(self) -> Tuple[Dict, Dict]:
+        """Get status and diff stats, overlapping the two git children"""
+        try:
+            status_proc = subprocess.Popen(
+                ["git", "status", "--porcelain"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=self.cwd,
+            )
+            diff_proc = subprocess.Popen(
+                ["git", "diff", "--stat"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=self.cwd,
+            )
+        except OSError as e:
+            logger.error(f"Failed to spawn git: {e}")
+            return {"error": str(e)}, {"error": str(e)}
+
+        status_out, status_err = status_proc.communicate()
+        diff_out, diff_err = diff_proc.communicate()
+
+        if status_proc.returncode != 0:
+            logger.error(f"Git status failed: {status_err.strip()}")
+            git_status = {"error": status_err.strip()}
+        else:
+            git_status = self._parse_status(status_out)
+
+        if diff_proc.returncode != 0:
+            logger.error(f"Git diff failed: {diff_err.strip()}")
+            diff_stats = {"error": diff_err.strip()}
+        else:
+            diff_stats = self._parse_diff_stats(diff_out)
+
+        return git_status, diff_stats
+
     async def generate_from_analyses(self, change_analyses: List[Dict]) -> str:
         """Generate commit message from semantic change analyses"""
 
@@ -156,8 +212,7 @@ class CommitGenerator:
             file_details.append(file_info)
 
         # Get git status for additional context
-        git_status = self._analyze_git_status()
-        diff_stats = self._get_diff_stats()
+        git_status, diff_stats = self._snapshot_git_state()
 
         # Generate commit message using LLM
         prompt_context = {
@@ -241,8 +296,13 @@ class CommitGenerator:
                     commit_message = template_message
                     logger.info("Auto-fixed commit message using templates")
 
-            # Store this commit in memory for future RAG
-            self._store_commit_in_memory(commit_message, context)
+            # Store this commit in memory for future RAG; the write is
+            # bookkeeping (git rev-parse plus a buffered insert), so it
+            # runs on an executor instead of delaying the caller.
+            # Errors are swallowed and logged inside the helper
+            asyncio.get_running_loop().run_in_executor(
+                None, self._store_commit_in_memory, commit_message, context
+            )
 
             logger.info(f"Generated commit message: {commit_message}")
             return commit_message
@@ -322,9 +382,8 @@ class CommitGenerator:
             # Format for prompt
             rag_lines = []
             for commit in similar_commits:
-                similarity = commit.get('similarity', 0)
-                if similarity > 0.3:  # Only include reasonably similar commits
-                    rag_lines.append(f"- {commit['message']} (files: {', '.join(commit['files_changed'][:2])})")
+                if commit.similarity > 0.3:  # Only include reasonably similar commits
+                    rag_lines.append(f"- {commit.message} (files: {', '.join(commit.files_changed[:2])})")
             
             return "\n".join(rag_lines[:3])  # Max 3 examples
             
@@ -341,7 +400,8 @@ class CommitGenerator:
                     ["git", "rev-parse", "HEAD"],
                     capture_output=True,
                     text=True,
-                    check=True
+                    check=True,
+                    cwd=self.cwd
                 )
                 commit_hash = result.stdout.strip()
             except:
@@ -388,7 +448,7 @@ class CommitGenerator:
             
             # Add files if requested
             if add_all:
-                subprocess.run(["git", "add", "."], check=True)
+                subprocess.run(["git", "add", "."], check=True, cwd=self.cwd)
 
             # Create commit
             result = subprocess.run(
@@ -396,6 +456,7 @@ class CommitGenerator:
                 capture_output=True,
                 text=True,
                 check=True,
+                cwd=self.cwd,
             )
 
             logger.info(f"✅ Commit created: {message}")
@@ -455,7 +516,8 @@ class CommitGenerator:
                 ["git", "log", f"--max-count={limit}", "--pretty=format:%H|%s|%an|%ad", "--date=iso"],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                cwd=self.cwd
             )
             
             for line in result.stdout.strip().split("\n"):
@@ -472,7 +534,8 @@ class CommitGenerator:
                         ["git", "show", "--name-only", "--pretty=format:", commit_hash],
                         capture_output=True,
                         text=True,
-                        check=True
+                        check=True,
+                        cwd=self.cwd
                     )
                     
                     files_changed = [f for f in files_result.stdout.strip().split("\n") if f]
@@ -484,7 +547,11 @@ class CommitGenerator:
                         files_changed=files_changed,
                         semantic_changes={}  # Could enhance this with actual analysis
                     )
-            
+
+            # Land the tail of the write buffer in one transaction
+            # rather than leaving it for the next read or exit
+            self.memory.flush()
+
             logger.info(f"Populated memory with {limit} historical commits")
             
         except Exception as e:
@@ -20,6 +20,50 @@ class OllamaClient:
         self.base_url = config.llm_host.rstrip("/")
         self.model = config.llm_model
         self.temperature = config.temperature
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get (or open) the shared HTTP session"""
+        # One keep-alive session per client instead of a fresh TCP
+        # handshake per request; generations in a watch session all hit
+        # the same Ollama host
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=16, keepalive_timeout=60
+                ),
+                # Long generations arrive well over the 64KB default
+                # read buffer; a big buffer keeps the socket drained
+                # instead of stalling the server mid-response
+                read_bufsize=4 * 1024 * 1024,
+            )
+        return self._session
+
+    async def warmup(self) -> None:
+        """Prime DNS and the TCP connection ahead of the first real call"""
+        # Connection setup is ~50-200ms of the first request; a throwaway
+        # HEAD pays it early so it can overlap with other startup work.
+        # Failures don't matter - the real call will report them properly
+        try:
+            async with self._get_session().head(
+                self.base_url, timeout=aiohttp.ClientTimeout(total=1)
+            ):
+                pass
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "OllamaClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     async def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text using Ollama"""
@@ -38,20 +82,19 @@ class OllamaClient:
             payload["system"] = system_prompt
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("response", "").strip()
-                    else:
-                        error_text = await response.text()
-                        raise LLMError(
-                            f"Ollama API error {response.status}: {error_text}"
-                        )
+            async with self._get_session().post(
+                f"{self.base_url}/api/generate",
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    return result.get("response", "").strip()
+                else:
+                    error_text = await response.text()
+                    raise LLMError(
+                        f"Ollama API error {response.status}: {error_text}"
+                    )
 
         except asyncio.TimeoutError:
             logger.error("Ollama request timed out")
@@ -66,22 +109,21 @@ class OllamaClient:
     async def check_model_availability(self) -> bool:
         """Check if the specified model is available"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        models = [model["name"] for model in data.get("models", [])]
-                        # Check for exact match or with :latest suffix
-                        return (
-                            self.model in models
-                            or f"{self.model}:latest" in models
-                            or any(
-                                model.startswith(f"{self.model}:") for model in models
-                            )
+            async with self._get_session().get(
+                f"{self.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    models = [model["name"] for model in data.get("models", [])]
+                    # Check for exact match or with :latest suffix
+                    return (
+                        self.model in models
+                        or f"{self.model}:latest" in models
+                        or any(
+                            model.startswith(f"{self.model}:") for model in models
                         )
-                    return False
+                    )
+                return False
         except Exception as e:
             logger.error(f"Failed to check model availability: {e}")
             return False
@@ -89,10 +131,9 @@ class OllamaClient:
     async def health_check(self) -> bool:
         """Check if Ollama is running and responsive"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    return response.status == 200
+            async with self._get_session().get(
+                f"{self.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                return response.status == 200
         except:
             return False
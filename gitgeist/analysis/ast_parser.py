@@ -1,5 +1,9 @@
 # gitgeist/analysis/ast_parser.py
+import functools
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -27,6 +31,44 @@ from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Grammar loaders by language name; compiled grammars and parsers are
+# cached below so every GitgeistASTParser shares them
+if TREE_SITTER_AVAILABLE:
+    _LANGUAGE_LOADERS = {
+        "python": tspython.language,
+        "javascript": tsjs.language,
+        "typescript": tsts.language_typescript,
+    }
+else:
+    _LANGUAGE_LOADERS = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_language(name: str) -> "Language":
+    """Compile (once per process) the grammar for a language"""
+    return Language(_LANGUAGE_LOADERS[name]())
+
+
+def _make_parser(name: str) -> "Parser":
+    """Build a Parser for a language from the cached grammar
+
+    Only the Language is shared: Parser objects hold mutable parse
+    state and are not safe for concurrent use, so each GitgeistASTParser
+    (one per worker thread in the git-handler fan-out) owns its own.
+    """
+    parser = Parser()
+    parser.language = _get_language(name)
+    return parser
+
+
+# Previous (bytes, tree) pairs kept per path for incremental re-parsing
+_TREE_CACHE_SIZE = 32
+
+# Structure analyses kept per content hash; editors re-save identical
+# bytes often enough (focus-loss touch, formatter no-op) to make the
+# short-circuit worthwhile
+_RESULT_CACHE_SIZE = 128
+
 
 class GitgeistASTParser:
     """AST parser for multi-language semantic analysis"""
@@ -35,31 +77,31 @@ class GitgeistASTParser:
         self.languages = {}
         self.parsers = {}
         self.detector = LanguageDetector()
+        self._tree_cache: "OrderedDict[str, Tuple[bytes, object]]" = OrderedDict()
+        self._result_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        # The watcher shares one instance across executor threads, so
+        # cache bookkeeping (and the parser behind it) is serialized;
+        # parses hold the GIL anyway, so nothing is lost to the lock
+        self._cache_lock = threading.Lock()
 
         if TREE_SITTER_AVAILABLE:
             try:
-                self.languages = {
-                    "python": Language(tspython.language()),
-                    "javascript": Language(tsjs.language()),
-                    "typescript": Language(tsts.language_typescript()),
-                }
-                self._init_parsers()
-                logger.info(
+                # Grammar loading costs tens of milliseconds per
+                # language, so instances share the cached Language
+                # objects; the Parsers themselves stay per-instance
+                for name in _LANGUAGE_LOADERS:
+                    self.languages[name] = _get_language(name)
+                    self.parsers[name] = _make_parser(name)
+                logger.debug(
                     f"Tree-sitter initialized with languages: {list(self.languages.keys())}"
                 )
             except Exception as e:
                 logger.error(f"Failed to initialize tree-sitter: {e}")
                 self.languages = {}
+                self.parsers = {}
         else:
             logger.warning("Tree-sitter not available - semantic analysis disabled")
 
-    def _init_parsers(self):
-        """Initialize parsers for each supported language"""
-        for lang_name, language in self.languages.items():
-            parser = Parser()
-            parser.language = language
-            self.parsers[lang_name] = parser
-
     def detect_language(self, filepath: str, content: str = None) -> Optional[str]:
         """Detect programming language using enhanced detector"""
         language = self.detector.detect_language(filepath, content)
@@ -83,19 +125,72 @@ class GitgeistASTParser:
             with open(filepath, "rb") as f:
                 code = f.read()
 
-            tree = self.parsers[language].parse(code)
+            tree = self._parse_incremental(filepath, language, code)
             return (language, tree.root_node)
         except Exception as e:
             logger.error(f"Error parsing {filepath}: {e}")
             return None
 
+    @staticmethod
+    def _point_at(code: bytes, offset: int) -> Tuple[int, int]:
+        """(row, column) of a byte offset, as tree-sitter expects"""
+        row = code.count(b"\n", 0, offset)
+        return (row, offset - (code.rfind(b"\n", 0, offset) + 1))
+
+    def _parse_incremental(self, filepath: str, language: str, code: bytes):
+        """Parse, reusing the previous tree for this path when available"""
+        with self._cache_lock:
+            return self._parse_incremental_locked(filepath, language, code)
+
+    def _parse_incremental_locked(self, filepath: str, language: str, code: bytes):
+        parser = self.parsers[language]
+        old_tree = None
+
+        cached = self._tree_cache.get(filepath)
+        if cached is not None:
+            old_code, old_tree = cached
+            if old_code == code:
+                self._tree_cache.move_to_end(filepath)
+                return old_tree
+            # Describe the change as one edit spanning everything outside
+            # the common prefix/suffix; coarse, but it lets tree-sitter
+            # re-lex only the changed region instead of the whole file
+            prefix = len(os.path.commonprefix((old_code, code)))
+            suffix = len(
+                os.path.commonprefix(
+                    (old_code[prefix:][::-1], code[prefix:][::-1])
+                )
+            )
+            old_end, new_end = len(old_code) - suffix, len(code) - suffix
+            old_tree.edit(
+                start_byte=prefix,
+                old_end_byte=old_end,
+                new_end_byte=new_end,
+                start_point=self._point_at(old_code, prefix),
+                old_end_point=self._point_at(old_code, old_end),
+                new_end_point=self._point_at(code, new_end),
+            )
+
+        if old_tree is not None:
+            tree = parser.parse(code, old_tree)
+        else:
+            tree = parser.parse(code)
+        self._tree_cache[filepath] = (code, tree)
+        self._tree_cache.move_to_end(filepath)
+        if len(self._tree_cache) > _TREE_CACHE_SIZE:
+            self._tree_cache.popitem(last=False)
+        return tree
+
     def parse_content(self, content: str, language: str) -> Optional[Node]:
         """Parse content string and return root node"""
         if not TREE_SITTER_AVAILABLE or language not in self.parsers:
             return None
 
         try:
-            tree = self.parsers[language].parse(content.encode("utf-8"))
+            # One lock for parser use too - the instance may be shared
+            # across threads and Parsers hold mutable parse state
+            with self._cache_lock:
+                tree = self.parsers[language].parse(content.encode("utf-8"))
             return tree.root_node
         except Exception as e:
             logger.error(f"Error parsing content: {e}")
@@ -258,19 +353,42 @@ class GitgeistASTParser:
             "total_lines": root_node.end_point[0] + 1,
         }
 
+    @staticmethod
+    def _copy_analysis(result: Dict) -> Dict:
+        """Copy a cached analysis so callers can't mutate the cache"""
+        copied = dict(result)
+        for key in ("functions", "classes", "imports"):
+            copied[key] = [dict(item) for item in result[key]]
+        return copied
+
     def analyze_content_structure(self, content: str, language: str) -> Optional[Dict]:
         """Analyze content structure from string"""
+        key = (
+            hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest(),
+            language,
+        )
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return self._copy_analysis(cached)
+
         root_node = self.parse_content(content, language)
         if not root_node:
             return None
 
-        return {
+        result = {
             "language": language,
             "functions": self.extract_functions(root_node, language),
             "classes": self.extract_classes(root_node, language),
             "imports": self.extract_imports(root_node, language),
             "total_lines": root_node.end_point[0] + 1,
         }
+        with self._cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return self._copy_analysis(result)
 
     def semantic_diff(self, old_content: str, new_content: str, language: str) -> Dict:
         """Compare two versions of code at semantic level"""
@@ -299,17 +417,17 @@ class GitgeistASTParser:
             "imports_changed": False,
         }
 
-        # Compare functions
+        # Compare functions; dict key views do the set algebra in C
+        # without materializing a set per operand
         old_funcs = {f["name"]: f for f in old.get("functions", [])}
         new_funcs = {f["name"]: f for f in new.get("functions", [])}
+        old_names, new_names = old_funcs.keys(), new_funcs.keys()
 
-        changes["functions_added"] = list(set(new_funcs.keys()) - set(old_funcs.keys()))
-        changes["functions_removed"] = list(
-            set(old_funcs.keys()) - set(new_funcs.keys())
-        )
+        changes["functions_added"] = list(new_names - old_names)
+        changes["functions_removed"] = list(old_names - new_names)
 
         # Check for modified functions (line number changes as proxy)
-        for name in set(old_funcs.keys()) & set(new_funcs.keys()):
+        for name in old_names & new_names:
             if (
                 old_funcs[name]["start_line"] != new_funcs[name]["start_line"]
                 or old_funcs[name]["end_line"] != new_funcs[name]["end_line"]
@@ -320,12 +438,8 @@ class GitgeistASTParser:
         old_classes = {c["name"]: c for c in old.get("classes", [])}
         new_classes = {c["name"]: c for c in new.get("classes", [])}
 
-        changes["classes_added"] = list(
-            set(new_classes.keys()) - set(old_classes.keys())
-        )
-        changes["classes_removed"] = list(
-            set(old_classes.keys()) - set(new_classes.keys())
-        )
+        changes["classes_added"] = list(new_classes.keys() - old_classes.keys())
+        changes["classes_removed"] = list(old_classes.keys() - new_classes.keys())
 
         # Compare imports (simple check)
         old_imports = set(i["statement"] for i in old.get("imports", []))
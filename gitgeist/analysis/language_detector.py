@@ -73,13 +73,16 @@ class LanguageDetector:
     @classmethod
     def detect_language(cls, filepath: str, content: str = None) -> Optional[str]:
         """Detect programming language from file path and content"""
+        # Try extension first: one rpartition plus a dict probe, no Path
+        # object on the hot path (called per file event)
+        root, _, ext = filepath.rpartition('.')
+        if root:
+            language = _EXT2LANG.get(ext.lower())
+            if language:
+                return language
+
         path = Path(filepath)
-        
-        # Try extension first
-        language = cls.EXTENSIONS.get(path.suffix.lower())
-        if language:
-            return language
-        
+
         # Check shebang if no extension match
         if content:
             language = cls._detect_from_shebang(content)
@@ -158,9 +161,14 @@ class LanguageDetector:
         # Test files
         if 'test' in path.name.lower() or path.name.startswith('test_'):
             return 'test'
-        
+
         # Build files
         if path.name.lower() in ['makefile', 'dockerfile', 'build.gradle', 'pom.xml']:
             return 'build'
-        
-        return 'other'
\ No newline at end of file
+
+        return 'other'
+
+
+# EXTENSIONS rekeyed without the leading dot, matching what rpartition
+# hands back; built once at import
+_EXT2LANG = {ext[1:]: lang for ext, lang in LanguageDetector.EXTENSIONS.items()}
\ No newline at end of file
@@ -92,10 +92,7 @@ def init(
     )
 
     # Validate configuration
-    config_dict = {
-        k: str(v) if isinstance(v, Path) else v for k, v in config.__dict__.items()
-    }
-    validation_errors = validate_config(config_dict)
+    validation_errors = validate_config(config.to_dict())
     if validation_errors:
         console.print("❌ Configuration validation failed:", style="red")
         for error in validation_errors:
@@ -138,6 +135,8 @@ def init(
                     "Ollama not running. Start with: ollama serve", style="red"
                 )
 
+        await llm_client.close()
+
     asyncio.run(test_connection())
 
     # Success message
@@ -202,12 +201,18 @@ def commit(
     print_logo()
 
     async def run_commit():
+        generator = None
+        warmup_task = None
         try:
             config = GitgeistConfig.load()
             setup_logger(config.log_file)
 
             generator = CommitGenerator(config)
 
+            # Overlap DNS/TCP setup with the repo analysis below so the
+            # first generation starts on a warm connection
+            warmup_task = asyncio.ensure_future(generator.llm_client.warmup())
+
             # Check for changes
             git_handler = GitHandler()
             if not git_handler.has_uncommitted_changes():
@@ -227,7 +232,9 @@ def commit(
                     )
 
                     # Get enhanced diff summary
-                    diff_summary = git_handler.get_enhanced_diff_summary()
+                    diff_summary = (
+                        await git_handler.get_enhanced_diff_summary_async()
+                    )
                     progress.update(task, description="✅ Analysis complete")
 
                 # Display results
@@ -267,9 +274,8 @@ def commit(
                     if similar_commits:
                         console.print("\n🔍 [bold]Similar past commits:[/bold]")
                         for commit in similar_commits:
-                            similarity = commit.get('similarity', 0)
-                            if similarity > 0.3:
-                                console.print(f"  • {commit['message']} (similarity: {similarity:.2f})")
+                            if commit.similarity > 0.3:
+                                console.print(f"  • {commit.message} (similarity: {commit.similarity:.2f})")
                 except Exception:
                     pass
                 
@@ -339,6 +345,11 @@ def commit(
         except Exception as e:
             console.print(f"❌ Error: {e}", style="red")
             raise typer.Exit(1)
+        finally:
+            if warmup_task is not None and not warmup_task.done():
+                warmup_task.cancel()
+            if generator is not None:
+                await generator.llm_client.close()
 
     asyncio.run(run_commit())
 
@@ -458,6 +469,8 @@ def status():
                 console.print("  ❌ Ollama not responding", style="red")
                 console.print("     Start with: ollama serve", style="dim")
 
+            await llm_client.close()
+
         except FileNotFoundError:
             console.print(
                 "❌ No configuration found. Run 'gitgeist init' first.", style="red"
@@ -5,11 +5,12 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
 
-from gitgeist.integrations.github import GitHubIntegration
 from gitgeist.utils.error_handler import handle_errors
 
+# Heavy imports (GitHubIntegration, rich panels) are deferred into the
+# command bodies so unrelated `gitgeist` subcommands don't pay the cost
+
 console = Console()
 github_app = typer.Typer(name="github", help="GitHub integration commands")
 
@@ -22,7 +23,10 @@ def create_pull_request(
     token: Optional[str] = typer.Option(None, "--token", help="GitHub token")
 ):
     """Create pull request from current branch"""
-    
+    from rich.panel import Panel
+
+    from gitgeist.integrations.github import GitHubIntegration
+
     # Get token from environment if not provided
     if not token:
         token = os.getenv("GITHUB_TOKEN")
@@ -32,11 +36,10 @@ def create_pull_request(
         raise typer.Exit(1)
     
     async def create_pr():
-        github = GitHubIntegration(token)
-        
         try:
-            pr = await github.auto_create_pr_from_branch(title, body)
-            
+            async with GitHubIntegration(token) as github:
+                pr = await github.auto_create_pr_from_branch(title, body)
+
             console.print(Panel(
                 f"✅ [bold green]Pull Request Created![/bold green]\n\n"
                 f"Title: {pr['title']}\n"
@@ -60,7 +63,8 @@ def list_issues(
     token: Optional[str] = typer.Option(None, "--token", help="GitHub token")
 ):
     """List repository issues"""
-    
+    from gitgeist.integrations.github import GitHubIntegration
+
     # Get token from environment if not provided
     if not token:
         token = os.getenv("GITHUB_TOKEN")
@@ -68,16 +72,17 @@ def list_issues(
     async def get_issues():
         github = GitHubIntegration(token)
         repo_info = github.get_repo_from_remote()
-        
+
         if not repo_info:
             console.print("❌ Not a GitHub repository", style="red")
             raise typer.Exit(1)
-        
+
         owner, repo = repo_info
-        
+
         try:
-            issues = await github.get_issues(owner, repo, state)
-            
+            async with github:
+                issues = await github.get_issues(owner, repo, state)
+
             if not issues:
                 console.print(f"No {state} issues found", style="yellow")
                 return
@@ -87,7 +92,7 @@ def list_issues(
             for issue in issues[:10]:  # Show first 10
                 title = issue['title']
                 number = issue['number']
-                labels = [label['name'] for label in issue.get('labels', [])]
+                labels = issue.get('labels', [])
                 label_text = f" [{', '.join(labels)}]" if labels else ""
                 
                 console.print(f"#{number}: {title}{label_text}")
@@ -106,6 +111,8 @@ def list_issues(
 @handle_errors("Repository info")
 def repository_info():
     """Show GitHub repository information"""
+    from gitgeist.integrations.github import GitHubIntegration
+
     github = GitHubIntegration()
     repo_info = github.get_repo_from_remote()
     
@@ -4,12 +4,12 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-from gitgeist.core.workspace import WorkspaceManager, MultiRepoCommitGenerator
 from gitgeist.utils.error_handler import handle_errors
 
+# WorkspaceManager / MultiRepoCommitGenerator and rich table imports are
+# deferred into the command bodies to keep CLI startup fast
+
 console = Console()
 workspace_app = typer.Typer(name="workspace", help="Multi-repository workspace management")
 
@@ -21,6 +21,8 @@ def add_repository(
     alias: Optional[str] = typer.Option(None, "--alias", "-a", help="Repository alias")
 ):
     """Add repository to workspace"""
+    from gitgeist.core.workspace import WorkspaceManager
+
     workspace = WorkspaceManager()
     
     try:
@@ -38,6 +40,8 @@ def remove_repository(
     alias: str = typer.Argument(..., help="Repository alias to remove")
 ):
     """Remove repository from workspace"""
+    from gitgeist.core.workspace import WorkspaceManager
+
     workspace = WorkspaceManager()
     
     if workspace.remove_repository(alias):
@@ -51,6 +55,10 @@ def remove_repository(
 @handle_errors("List repositories")
 def list_repositories():
     """List all repositories in workspace"""
+    from rich.table import Table
+
+    from gitgeist.core.workspace import WorkspaceManager
+
     workspace = WorkspaceManager()
     repositories = workspace.list_repositories()
     
@@ -76,6 +84,8 @@ def activate_repository(
     alias: str = typer.Argument(..., help="Repository alias to activate")
 ):
     """Set active repository"""
+    from gitgeist.core.workspace import WorkspaceManager
+
     workspace = WorkspaceManager()
     
     if workspace.set_active_repository(alias):
@@ -89,33 +99,37 @@ def activate_repository(
 @handle_errors("Workspace status")
 def workspace_status():
     """Show status of all repositories"""
+    from rich.live import Live
+    from rich.table import Table
+
+    from gitgeist.core.workspace import WorkspaceManager, MultiRepoCommitGenerator
+
     workspace = WorkspaceManager()
     multi_repo = MultiRepoCommitGenerator(workspace)
-    
-    status = multi_repo.get_status_all_repositories()
-    
-    if not status:
+
+    if not workspace.list_repositories():
         console.print("No repositories in workspace", style="yellow")
         return
-    
+
     table = Table(title="Repository Status")
     table.add_column("Repository", style="cyan")
     table.add_column("Changes", style="yellow")
     table.add_column("Status", style="green")
     table.add_column("Active", style="blue")
-    
-    for alias, info in status.items():
-        if "error" in info:
-            changes = "Error"
-            status_text = info["error"][:50]
-        else:
-            changes = str(info["changes"])
-            status_text = "Clean" if info["clean"] else "Modified"
-        
-        active = "Yes" if info["active"] else "No"
-        table.add_row(alias, changes, status_text, active)
-    
-    console.print(table)
+
+    # Render rows as each repository's status arrives instead of
+    # blocking on the slowest repo before showing anything
+    with Live(table, console=console, refresh_per_second=8):
+        for alias, info in multi_repo.iter_status_all_repositories():
+            if "error" in info:
+                changes = "Error"
+                status_text = info["error"][:50]
+            else:
+                changes = str(info["changes"])
+                status_text = "Clean" if info["clean"] else "Modified"
+
+            active = "Yes" if info["active"] else "No"
+            table.add_row(alias, changes, status_text, active)
 
 
 @workspace_app.command("commit-all")
@@ -125,6 +139,10 @@ def commit_all_repositories(
     auto: bool = typer.Option(False, "--auto", help="Auto-commit without confirmation")
 ):
     """Commit changes in all active repositories"""
+    from rich.table import Table
+
+    from gitgeist.core.workspace import WorkspaceManager, MultiRepoCommitGenerator
+
     workspace = WorkspaceManager()
     multi_repo = MultiRepoCommitGenerator(workspace)
     
@@ -142,19 +160,21 @@ def commit_all_repositories(
         return
     
     console.print("Committing to all repositories...")
-    results = multi_repo.commit_all_repositories(message)
-    
-    # Show results
+
+    # Stream results into the table as each repository finishes
+    from rich.live import Live
+
     table = Table(title="Commit Results")
     table.add_column("Repository", style="cyan")
     table.add_column("Result", style="green")
-    
-    for alias, success in results.items():
-        result = "✅ Success" if success else "❌ Failed"
-        table.add_row(alias, result)
-    
-    console.print(table)
-    
+
+    results = {}
+    with Live(table, console=console, refresh_per_second=8):
+        for alias, success in multi_repo.iter_commit_all_repositories(message):
+            results[alias] = success
+            result = "✅ Success" if success else "❌ Failed"
+            table.add_row(alias, result)
+
     success_count = sum(1 for success in results.values() if success)
     console.print(f"\n{success_count}/{len(results)} repositories committed successfully")
 
@@ -11,7 +11,20 @@ logger = get_logger(__name__)
 class BranchManager:
     """Manages branch-aware commit strategies"""
 
-    def __init__(self):
+    # Branch classification tables: exact names first, then the prefix
+    # before the first "/" - a single dict lookup instead of chained startswith
+    _EXACT_TYPES = {"main": "main", "master": "main", "develop": "develop"}
+    _PREFIX_TYPES = {
+        "feature": "feature",
+        "fix": "bugfix",
+        "hotfix": "hotfix",
+        "release": "release",
+        "docs": "documentation",
+    }
+
+    def __init__(self, cwd=None):
+        # Repository to query; None means the process working directory
+        self.cwd = cwd
         self.branch_patterns = {
             "feature/": {
                 "style": "conventional",
@@ -57,6 +70,8 @@ class BranchManager:
                 "max_length": 72
             }
         }
+        # Memoized branch -> config resolutions; cleared if patterns change
+        self._config_cache: Dict[str, Dict] = {}
 
     def get_current_branch(self) -> Optional[str]:
         """Get current git branch name"""
@@ -65,7 +80,8 @@ class BranchManager:
                 ["git", "branch", "--show-current"],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                cwd=self.cwd
             )
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
@@ -76,19 +92,31 @@ class BranchManager:
         """Get configuration for current or specified branch"""
         if not branch_name:
             branch_name = self.get_current_branch()
-        
+
         if not branch_name:
             return self.branch_patterns["main"]
-        
+
+        # Resolution is memoized - a watch session asks about the same
+        # branch over and over
+        cached = self._config_cache.get(branch_name)
+        if cached is not None:
+            return cached
+
+        config = self._resolve_branch_config(branch_name)
+        self._config_cache[branch_name] = config
+        return config
+
+    def _resolve_branch_config(self, branch_name: str) -> Dict:
+        """Resolve branch name to its pattern config"""
         # Check for exact match first
         if branch_name in self.branch_patterns:
             return self.branch_patterns[branch_name]
-        
+
         # Check for pattern matches
         for pattern, config in self.branch_patterns.items():
             if branch_name.startswith(pattern):
                 return config
-        
+
         # Default to main branch config
         return self.branch_patterns["main"]
 
@@ -184,20 +212,12 @@ class BranchManager:
         
         if not current_branch:
             return "unknown"
-        
-        if current_branch in ["main", "master"]:
-            return "main"
-        elif current_branch == "develop":
-            return "develop"
-        elif current_branch.startswith("feature/"):
-            return "feature"
-        elif current_branch.startswith("fix/"):
-            return "bugfix"
-        elif current_branch.startswith("hotfix/"):
-            return "hotfix"
-        elif current_branch.startswith("release/"):
-            return "release"
-        elif current_branch.startswith("docs/"):
-            return "documentation"
-        else:
-            return "other"
\ No newline at end of file
+
+        exact = self._EXACT_TYPES.get(current_branch)
+        if exact:
+            return exact
+
+        prefix, separator, _ = current_branch.partition("/")
+        if separator:
+            return self._PREFIX_TYPES.get(prefix, "other")
+        return "other"
\ No newline at end of file
@@ -1,10 +1,13 @@
 # gitgeist/core/caching.py
 import hashlib
-import json
+import os
 import pickle
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from gitgeist.utils.logger import get_logger
 
@@ -18,35 +21,61 @@ class CacheManager:
         self.cache_dir = cache_dir or Path("data/cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = 3600  # 1 hour default TTL
+        self.db_path = self.cache_dir / "cache.db"
+        # Single connection shared across worker threads; writes are
+        # serialized with a lock instead of per-call connects
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        # Hot keys are re-hashed constantly; memoize key -> digest
+        self._keyhash_cache: Dict[str, str] = {}
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    timestamp REAL,
+                    ttl INTEGER,
+                    value BLOB
+                )
+            """)
+            self._db.commit()
 
     def _get_cache_key(self, key: str) -> str:
         """Generate cache key hash"""
-        return hashlib.md5(key.encode()).hexdigest()
-
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path"""
-        cache_key = self._get_cache_key(key)
-        return self.cache_dir / f"{cache_key}.cache"
+        cache_key = self._keyhash_cache.get(key)
+        if cache_key is None:
+            cache_key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+            # Keep the memo bounded for unbounded keyspaces
+            if len(self._keyhash_cache) > 4096:
+                self._keyhash_cache.clear()
+            self._keyhash_cache[key] = cache_key
+        return cache_key
 
     def get(self, key: str) -> Optional[Any]:
         """Get cached value"""
         try:
-            cache_path = self._get_cache_path(key)
-            
-            if not cache_path.exists():
+            cache_key = self._get_cache_key(key)
+
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT value, timestamp, ttl FROM cache WHERE key = ?",
+                    (cache_key,),
+                ).fetchone()
+
+            if row is None:
                 return None
-            
-            with open(cache_path, 'rb') as f:
-                data = pickle.load(f)
-            
+
+            value, timestamp, ttl = row
+
             # Check TTL
-            if time.time() - data['timestamp'] > self.ttl:
-                cache_path.unlink()  # Remove expired cache
+            if time.time() - timestamp > (ttl or self.ttl):
+                self._delete(cache_key)
                 return None
-            
+
             logger.debug(f"Cache hit for key: {key[:20]}...")
-            return data['value']
-            
+            return pickle.loads(value)
+
         except Exception as e:
             logger.error(f"Cache get failed for {key}: {e}")
             return None
@@ -54,20 +83,19 @@ class CacheManager:
     def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """Set cached value"""
         try:
-            cache_path = self._get_cache_path(key)
-            
-            data = {
-                'value': value,
-                'timestamp': time.time(),
-                'ttl': ttl or self.ttl
-            }
-            
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
-            
+            cache_key = self._get_cache_key(key)
+
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, timestamp, ttl, value) "
+                    "VALUES (?, ?, ?, ?)",
+                    (cache_key, time.time(), ttl or self.ttl, pickle.dumps(value)),
+                )
+                self._db.commit()
+
             logger.debug(f"Cache set for key: {key[:20]}...")
             return True
-            
+
         except Exception as e:
             logger.error(f"Cache set failed for {key}: {e}")
             return False
@@ -75,51 +103,51 @@ class CacheManager:
     def invalidate(self, key: str) -> bool:
         """Invalidate cached value"""
         try:
-            cache_path = self._get_cache_path(key)
-            if cache_path.exists():
-                cache_path.unlink()
+            if self._delete(self._get_cache_key(key)):
                 logger.debug(f"Cache invalidated for key: {key[:20]}...")
                 return True
         except Exception as e:
             logger.error(f"Cache invalidation failed for {key}: {e}")
         return False
 
+    def _delete(self, cache_key: str) -> bool:
+        """Delete a row by hashed key"""
+        with self._db_lock:
+            cursor = self._db.execute(
+                "DELETE FROM cache WHERE key = ?", (cache_key,)
+            )
+            self._db.commit()
+        return cursor.rowcount > 0
+
     def clear_expired(self) -> int:
         """Clear expired cache entries"""
-        cleared = 0
         try:
-            current_time = time.time()
-            
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    with open(cache_file, 'rb') as f:
-                        data = pickle.load(f)
-                    
-                    if current_time - data['timestamp'] > data.get('ttl', self.ttl):
-                        cache_file.unlink()
-                        cleared += 1
-                        
-                except Exception:
-                    # Remove corrupted cache files
-                    cache_file.unlink()
-                    cleared += 1
-            
+            with self._db_lock:
+                cursor = self._db.execute(
+                    "DELETE FROM cache WHERE ? - timestamp > ttl", (time.time(),)
+                )
+                self._db.commit()
+            cleared = cursor.rowcount
+
             if cleared > 0:
                 logger.info(f"Cleared {cleared} expired cache entries")
-                
+            return cleared
+
         except Exception as e:
             logger.error(f"Cache cleanup failed: {e}")
-        
-        return cleared
+            return 0
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         try:
-            cache_files = list(self.cache_dir.glob("*.cache"))
-            total_size = sum(f.stat().st_size for f in cache_files)
-            
+            with self._db_lock:
+                entries = self._db.execute(
+                    "SELECT COUNT(*) FROM cache"
+                ).fetchone()[0]
+            total_size = self.db_path.stat().st_size if self.db_path.exists() else 0
+
             return {
-                'entries': len(cache_files),
+                'entries': entries,
                 'total_size_mb': total_size / (1024 * 1024),
                 'cache_dir': str(self.cache_dir)
             }
@@ -127,12 +155,33 @@ class CacheManager:
             logger.error(f"Failed to get cache stats: {e}")
             return {'entries': 0, 'total_size_mb': 0, 'cache_dir': str(self.cache_dir)}
 
+    def _all_keys(self) -> set:
+        """Get all hashed keys currently stored"""
+        with self._db_lock:
+            rows = self._db.execute("SELECT key FROM cache").fetchall()
+        return {row[0] for row in rows}
+
 
 class FileAnalysisCache:
     """Specialized cache for file analysis results"""
 
     def __init__(self, cache_manager: CacheManager = None):
         self.cache = cache_manager or CacheManager()
+        # Known hashed keys, seeded from the store once so negative
+        # lookups skip the database probe entirely (most files aren't cached)
+        self._known_keys = self.cache._all_keys()
+        # filepath -> (stat stamp, content hash): unchanged files are
+        # detected with a single stat() instead of a full read + hash
+        self._stamp_hashes: Dict[str, tuple] = {}
+
+    def get_file_stamp(self, filepath: str) -> Optional[str]:
+        """Get stat-based freshness stamp for a file"""
+        try:
+            st = Path(filepath).stat()
+            return f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+        except OSError as e:
+            logger.error(f"Failed to stat file {filepath}: {e}")
+            return None
 
     def get_file_analysis(self, filepath: str, file_hash: str) -> Optional[Dict]:
         """Get cached file analysis"""
@@ -142,24 +191,56 @@ class FileAnalysisCache:
     def set_file_analysis(self, filepath: str, file_hash: str, analysis: Dict) -> bool:
         """Cache file analysis"""
         key = f"file_analysis:{filepath}:{file_hash}"
-        return self.cache.set(key, analysis, ttl=7200)  # 2 hours
+        if self.cache.set(key, analysis, ttl=7200):  # 2 hours
+            self._known_keys.add(self.cache._get_cache_key(key))
+            return True
+        return False
 
     def get_file_hash(self, filepath: str) -> Optional[str]:
-        """Get file content hash"""
+        """Get file content hash, reusing the stamp memo when unchanged"""
+        stamp = self.get_file_stamp(filepath)
+        if stamp:
+            memo = self._stamp_hashes.get(filepath)
+            if memo and memo[0] == stamp:
+                return memo[1]
+
         try:
             with open(filepath, 'rb') as f:
                 content = f.read()
-            return hashlib.md5(content).hexdigest()
+            file_hash = hashlib.md5(content).hexdigest()
+            if stamp:
+                self._stamp_hashes[filepath] = (stamp, file_hash)
+            return file_hash
         except Exception as e:
             logger.error(f"Failed to hash file {filepath}: {e}")
             return None
 
+    def hash_many(self, filepaths: List[str]) -> Dict[str, str]:
+        """Hash many files in parallel; hashing is I/O-bound, not GIL-bound"""
+        if not filepaths:
+            return {}
+
+        workers = min(len(filepaths), (os.cpu_count() or 4) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = executor.map(self.get_file_hash, filepaths)
+
+        return {
+            filepath: file_hash
+            for filepath, file_hash in zip(filepaths, hashes)
+            if file_hash
+        }
+
     def is_file_cached(self, filepath: str) -> bool:
         """Check if file analysis is cached and valid"""
         file_hash = self.get_file_hash(filepath)
         if not file_hash:
             return False
-        
+
+        # Negative fast path: unknown key means no disk lookup needed
+        key = f"file_analysis:{filepath}:{file_hash}"
+        if self.cache._get_cache_key(key) not in self._known_keys:
+            return False
+
         cached = self.get_file_analysis(filepath, file_hash)
         return cached is not None
 
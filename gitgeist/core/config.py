@@ -1,9 +1,14 @@
 # gitgeist/core/config.py
-import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
+# Parsed configs keyed by path, validated against st_mtime_ns so a
+# long-running watcher only pays a stat() per load instead of a re-parse
+_config_cache: Dict[Path, Tuple[int, "GitgeistConfig"]] = {}
 
 
 @dataclass
@@ -56,14 +61,20 @@ class GitgeistConfig:
         config_path = config_path or Path(".gitgeist.json")
 
         if config_path.exists():
-            with open(config_path) as f:
-                data = json.load(f)
+            mtime_ns = config_path.stat().st_mtime_ns
+            cached = _config_cache.get(config_path)
+            if cached and cached[0] == mtime_ns:
+                return cached[1]
+
+            data = orjson.loads(config_path.read_bytes())
             # Convert string paths back to Path objects
             if "data_dir" in data:
                 data["data_dir"] = Path(data["data_dir"])
             if "log_file" in data:
                 data["log_file"] = Path(data["log_file"])
-            return cls(**data)
+            config = cls(**data)
+            _config_cache[config_path] = (mtime_ns, config)
+            return config
 
         # Load from environment
         return cls(
@@ -72,17 +83,22 @@ class GitgeistConfig:
             autonomous_mode=os.getenv("GITGEIST_AUTONOMOUS", "false").lower() == "true",
         )
 
+    def to_dict(self) -> Dict:
+        """Flat dict of fields with Paths as strings, ready to serialize"""
+        # The config is flat, so a shallow copy of __dict__ does it; no
+        # need for asdict's recursive deep copy
+        data = self.__dict__.copy()
+        data["data_dir"] = str(self.data_dir)
+        data["log_file"] = str(self.log_file)
+        return data
+
     def save(self, config_path: Optional[Path] = None):
         """Save configuration to file"""
         config_path = config_path or Path(".gitgeist.json")
 
-        # Convert to JSON-serializable format
-        data = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, Path):
-                data[key] = str(value)
-            else:
-                data[key] = value
+        config_path.write_bytes(
+            orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        )
 
-        with open(config_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Keep cached loads consistent with what was just written
+        _config_cache[config_path] = (config_path.stat().st_mtime_ns, self)
@@ -1,27 +1,131 @@
 # gitgeist/core/git_handler.py
+import asyncio
+import mmap
+import os
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from gitgeist.analysis.ast_parser import GitgeistASTParser
+from gitgeist.core.git_pool import get_git_pool
 from gitgeist.utils.exceptions import GitError
 from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Resolve the git binary once and hand every child the caller's full
+# environment plus two overrides: LC_ALL=C skips locale init and
+# GIT_OPTIONAL_LOCKS=0 keeps read-only commands from taking (and
+# writing) optional lockfiles. The full environment matters - commits
+# rely on GIT_AUTHOR_*/GIT_COMMITTER_*, signing on GNUPGHOME/GPG_TTY,
+# and remotes on SSH_AUTH_SOCK
+_GIT = shutil.which("git") or "git"
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+
+# Matches the per-file header of a combined `git diff` so one batched
+# invocation can be split back into per-file chunks
+_DIFF_HEADER_RE = re.compile(r"^diff --git a/.* b/(.*)$", re.MULTILINE)
+
+# Language detection is suffix-driven, so memoize per extension rather
+# than re-resolving for every file in a change set
+_suffix_lang_cache: Dict[str, Optional[str]] = {}
+
+def _line_count(s: str) -> int:
+    """Count lines without materializing a list of them"""
+    return s.count("\n") + (1 if s and not s.endswith("\n") else 0)
+
+
+# Parsers are not safe for concurrent use, so each worker thread gets
+# its own instance for the parallel semantic-diff fan-out
+_thread_local = threading.local()
+
+
+def _semantic_diff_pure(
+    old_content: str, new_content: str, language: str, filepath: str
+) -> Optional[Dict]:
+    """Diff two file versions semantically; takes contents, no git state"""
+    parser = getattr(_thread_local, "ast_parser", None)
+    if parser is None:
+        parser = GitgeistASTParser()
+        _thread_local.ast_parser = parser
+
+    try:
+        semantic_diff = parser.semantic_diff(old_content, new_content, language)
+        semantic_diff.update(
+            {
+                "filepath": filepath,
+                "language": language,
+                "old_lines": _line_count(old_content),
+                "new_lines": _line_count(new_content),
+            }
+        )
+        return semantic_diff
+    except Exception as e:
+        logger.error(f"Semantic diff failed for {filepath}: {e}")
+        return None
+
+
 class GitHandler:
     """Enhanced Git operations with semantic analysis"""
 
     def __init__(self):
         self.ast_parser = GitgeistASTParser()
+        # (key, files, recorded_at) memo for get_git_status
+        self._status_cache = None
+
+    def _status_cache_key(self):
+        """Key repo state on index/HEAD mtimes; None disables caching"""
+        try:
+            return (
+                os.stat(".git/index").st_mtime_ns,
+                os.stat(".git/HEAD").st_mtime_ns,
+            )
+        except OSError:
+            return None
+
+    def _invalidate_status_cache(self):
+        self._status_cache = None
+
+    def _read_object(self, ref: str) -> Optional[str]:
+        """Read one object via the shared batch pipe, no git show fork"""
+        return get_git_pool().read_object(ref)
+
+    def close(self):
+        """Release this repo's pooled cat-file child"""
+        get_git_pool().close()
+
+    async def _git(self, *args: str) -> bytes:
+        """Run one git command without blocking the event loop"""
+        proc = await asyncio.create_subprocess_exec(
+            _GIT,
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_GIT_ENV,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise GitError(f"git {args[0]} failed: {stderr.decode(errors='replace')}")
+        return stdout
 
     def is_git_repo(self) -> bool:
         """Check if current directory is a git repository"""
         try:
             subprocess.run(
-                ["git", "rev-parse", "--git-dir"], capture_output=True, check=True
+                [_GIT, "rev-parse", "--git-dir"],
+                capture_output=True,
+                check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
             )
             return True
         except subprocess.CalledProcessError:
@@ -32,79 +136,200 @@ class GitHandler:
         if not self.is_git_repo():
             raise GitError("Not a git repository")
 
+        # Repeated calls within a watcher tick reuse the memo; worktree
+        # edits don't bump the index mtime, so entries also expire fast
+        key = self._status_cache_key()
+        if key is not None and self._status_cache is not None:
+            cached_key, cached_files, recorded_at = self._status_cache
+            if cached_key == key and time.monotonic() - recorded_at < 1.0:
+                return cached_files
+
         try:
+            # porcelain v2 with NUL records parses renames and odd
+            # filenames correctly, and we walk the raw bytes directly
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                [
+                    _GIT,
+                    "status",
+                    "--porcelain=v2",
+                    "-z",
+                    "--untracked-files=all",
+                ],
                 capture_output=True,
-                text=True,
                 check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
             )
 
-            files = {
-                "modified": [],
-                "added": [],
-                "deleted": [],
-                "renamed": [],
-                "staged": [],
-            }
-
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-
-                index_status = line[0]
-                work_status = line[1]
-                filepath = line[3:]
-
-                # Handle staged files
-                if index_status != " ":
-                    files["staged"].append(filepath)
-
-                # Handle working directory changes
-                if work_status == "M":
-                    files["modified"].append(filepath)
-                elif work_status == "?":
-                    files["added"].append(filepath)
-                elif work_status == "D":
-                    files["deleted"].append(filepath)
-                elif "R" in line[:2]:
-                    files["renamed"].append(filepath)
+            files = self._parse_status_output(result.stdout)
 
+            # Re-key after the subprocess: git status may refresh the
+            # index file itself, which would bump the mtime we keyed on
+            key = self._status_cache_key()
+            if key is not None:
+                self._status_cache = (key, files, time.monotonic())
             return files
 
         except subprocess.CalledProcessError as e:
             raise GitError(f"Git status failed: {e}")
 
+    @staticmethod
+    def _parse_status_output(stdout: bytes) -> Dict:
+        """Parse porcelain v2 -z output into categorized file lists"""
+        files = {
+            "modified": [],
+            "added": [],
+            "deleted": [],
+            "renamed": [],
+            "staged": [],
+        }
+
+        records = stdout.split(b"\0")
+        index = 0
+        while index < len(records):
+            record = records[index]
+            index += 1
+            if not record:
+                continue
+
+            kind = record[:1]
+            if kind == b"?":
+                files["added"].append(os.fsdecode(record[2:]))
+                continue
+
+            if kind == b"1":
+                fields = record.split(b" ", 8)
+                xy, filepath = fields[1], os.fsdecode(fields[8])
+            elif kind == b"2":
+                fields = record.split(b" ", 9)
+                xy, filepath = fields[1], os.fsdecode(fields[9])
+                # Rename records carry the old path as the next token
+                index += 1
+                files["renamed"].append(filepath)
+            elif kind == b"u":
+                fields = record.split(b" ", 10)
+                xy, filepath = fields[1], os.fsdecode(fields[10])
+            else:
+                continue
+
+            # Index side (staged) and worktree side of the XY pair
+            if xy[0:1] != b".":
+                files["staged"].append(filepath)
+            work_status = xy[1:2]
+            if work_status == b"M":
+                files["modified"].append(filepath)
+            elif work_status == b"D":
+                files["deleted"].append(filepath)
+
+        return files
+
     def get_file_diff(self, filepath: str, staged: bool = False) -> Optional[str]:
         """Get text diff for a specific file"""
         try:
-            cmd = ["git", "diff"]
+            cmd = [_GIT, "diff"]
             if staged:
                 cmd.append("--staged")
             cmd.append(filepath)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
             return result.stdout if result.stdout.strip() else None
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to get diff for {filepath}: {e}")
             return None
 
+    def get_file_diffs(self, filepaths: List[str]) -> Dict[str, str]:
+        """Get text diffs for many files with a single git invocation"""
+        if not filepaths:
+            return {}
+
+        try:
+            result = subprocess.run(
+                [_GIT, "diff", "--"] + list(filepaths),
+                capture_output=True,
+                text=True,
+                check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Batched git diff failed: {e}")
+            return {}
+
+        return self._split_combined_diff(result.stdout)
+
+    @staticmethod
+    def _split_combined_diff(output: str) -> Dict[str, str]:
+        """Split combined `git diff` output into per-file chunks"""
+        # Split on the "diff --git a/... b/..." headers
+        diffs = {}
+        matches = list(_DIFF_HEADER_RE.finditer(output))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(output)
+            diffs[match.group(1)] = output[match.start():end]
+
+        return diffs
+
+    @staticmethod
+    def _parse_numstat_output(stdout: bytes) -> Dict[str, Tuple[int, int]]:
+        """Parse `git diff --numstat -z` into {path: (added, removed)}"""
+        stats = {}
+        tokens = stdout.split(b"\0")
+        i = 0
+        while i < len(tokens):
+            record = tokens[i]
+            i += 1
+            if not record:
+                continue
+
+            added, _, rest = record.partition(b"\t")
+            removed, _, path = rest.partition(b"\t")
+            if not path:
+                # Rename records put old and new paths in the next tokens
+                i += 1
+                path = tokens[i]
+                i += 1
+
+            # Binary files report "-" for both counts
+            stats[os.fsdecode(path)] = (
+                int(added) if added.isdigit() else 0,
+                int(removed) if removed.isdigit() else 0,
+            )
+
+        return stats
+
     def get_file_content_at_commit(
         self, filepath: str, commit: str = "HEAD"
     ) -> Optional[str]:
         """Get file content at specific commit"""
+        # Streams through the persistent cat-file pipe; returns None when
+        # the file doesn't exist at that commit
+        return self._read_object(f"{commit}:{filepath}")
+
+    def _detect_language(self, filepath: str) -> Optional[str]:
+        """Detect language with a per-suffix memo"""
+        suffix = os.path.splitext(filepath)[1]
+        if not suffix:
+            # Extensionless files (Makefile etc.) need the full detector
+            return self.ast_parser.detect_language(filepath)
+
         try:
-            cmd = ["git", "show", f"{commit}:{filepath}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return result.stdout
-        except subprocess.CalledProcessError:
-            # File might not exist at that commit
-            return None
+            return _suffix_lang_cache[suffix]
+        except KeyError:
+            language = self.ast_parser.detect_language(filepath)
+            _suffix_lang_cache[suffix] = language
+            return language
 
     def get_semantic_diff(self, filepath: str, staged: bool = False) -> Optional[Dict]:
         """Get semantic diff using AST analysis"""
-        language = self.ast_parser.detect_language(filepath)
+        language = self._detect_language(filepath)
         if not language:
             return None
 
@@ -117,23 +342,23 @@ class GitHandler:
 
             # Get new version (from working directory or staging area)
             if staged:
-                # Get staged version
-                try:
-                    result = subprocess.run(
-                        ["git", "show", f":{filepath}"],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    new_content = result.stdout
-                except subprocess.CalledProcessError:
+                # Get staged version through the cat-file pipe
+                new_content = self._read_object(f":{filepath}")
+                if new_content is None:
                     return None
             else:
-                # Get working directory version
+                # Get working directory version; mmap large files to
+                # skip one full buffer copy, plain read for small ones
                 try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        new_content = f.read()
-                except (IOError, UnicodeDecodeError) as e:
+                    with open(filepath, "rb") as f:
+                        if os.fstat(f.fileno()).st_size >= 64 * 1024:
+                            with mmap.mmap(
+                                f.fileno(), 0, access=mmap.ACCESS_READ
+                            ) as mm:
+                                new_content = bytes(mm).decode("utf-8")
+                        else:
+                            new_content = f.read().decode("utf-8")
+                except (IOError, ValueError, UnicodeDecodeError) as e:
                     logger.error(f"Failed to read {filepath}: {e}")
                     return None
 
@@ -147,8 +372,8 @@ class GitHandler:
                 {
                     "filepath": filepath,
                     "language": language,
-                    "old_lines": len(old_content.split("\n")) if old_content else 0,
-                    "new_lines": len(new_content.split("\n")),
+                    "old_lines": _line_count(old_content),
+                    "new_lines": _line_count(new_content),
                 }
             )
 
@@ -162,13 +387,17 @@ class GitHandler:
         """Get detailed diff statistics"""
         try:
             result = subprocess.run(
-                ["git", "diff", "--stat"], capture_output=True, text=True, check=True
+                [_GIT, "diff", "--stat"],
+                capture_output=True,
+                text=True,
+                check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
             )
 
-            lines = result.stdout.strip().split("\n")
             stats = {"files_changed": 0, "insertions": 0, "deletions": 0, "files": []}
 
-            for line in lines:
+            for line in result.stdout.splitlines():
                 if not line:
                     continue
 
@@ -186,11 +415,10 @@ class GitHandler:
                             stats["deletions"] = int(part.split()[0])
                 elif "|" in line and not line.startswith(" "):
                     # Parse file-specific stats: "filename | 5 ++---"
-                    parts = line.split("|")
-                    if len(parts) == 2:
-                        filename = parts[0].strip()
-                        changes = parts[1].strip()
-                        stats["files"].append({"name": filename, "changes": changes})
+                    filename, _, changes = line.partition("|")
+                    stats["files"].append(
+                        {"name": filename.strip(), "changes": changes.strip()}
+                    )
 
             return stats
 
@@ -200,8 +428,23 @@ class GitHandler:
 
     def get_enhanced_diff_summary(self) -> Dict:
         """Get comprehensive diff summary with both text and semantic analysis"""
+        return asyncio.run(self.get_enhanced_diff_summary_async())
+
+    async def get_enhanced_diff_summary_async(self) -> Dict:
+        """Async diff summary; status and text diffs run concurrently"""
         try:
-            files = self.get_git_status()
+            # Both subprocesses start immediately and run in parallel;
+            # numstat delivers per-file line counts directly, so no full
+            # diff text is generated or scanned here (get_file_diffs is
+            # the on-demand path for consumers that need the text)
+            status_out, numstat_out = await asyncio.gather(
+                self._git(
+                    "status", "--porcelain=v2", "-z", "--untracked-files=all"
+                ),
+                self._git("diff", "--numstat", "-z"),
+            )
+            files = self._parse_status_output(status_out)
+            line_stats = self._parse_numstat_output(numstat_out)
 
             summary = {
                 "text_changes": {},
@@ -223,22 +466,52 @@ class GitHandler:
             all_files = files.get("modified", []) + files.get("added", [])
             summary["summary"]["total_files"] = len(all_files)
 
+            # Gather old/new contents serially (the cat-file pipe is a
+            # single stream), then fan the CPU-bound semantic diffs out
+            # across a thread pool
+            jobs = []
             for filepath in all_files:
-                # Get text diff
-                text_diff = self.get_file_diff(filepath)
-                if text_diff:
-                    lines = text_diff.split("\n")
-                    additions = len([l for l in lines if l.startswith("+")])
-                    deletions = len([l for l in lines if l.startswith("-")])
+                language = self._detect_language(filepath)
+                if not language:
+                    continue
+
+                old_content = self.get_file_content_at_commit(filepath) or ""
+                try:
+                    with open(filepath, "r", encoding="utf-8") as f:
+                        new_content = f.read()
+                except (IOError, UnicodeDecodeError) as e:
+                    logger.error(f"Failed to read {filepath}: {e}")
+                    continue
+                jobs.append((filepath, old_content, new_content, language))
+
+            semantic_diffs = {}
+            if jobs:
+                loop = asyncio.get_running_loop()
+                with ThreadPoolExecutor(
+                    max_workers=min(len(jobs), os.cpu_count() or 4)
+                ) as executor:
+                    results = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                executor, _semantic_diff_pure, old, new, lang, fp
+                            )
+                            for fp, old, new, lang in jobs
+                        )
+                    )
+                for (filepath, _, _, _), result in zip(jobs, results):
+                    if result is not None:
+                        semantic_diffs[filepath] = result
 
+            for filepath in all_files:
+                counts = line_stats.get(filepath)
+                if counts:
                     summary["text_changes"][filepath] = {
-                        "diff": text_diff,
-                        "lines_added": additions,
-                        "lines_removed": deletions,
+                        "lines_added": counts[0],
+                        "lines_removed": counts[1],
                     }
 
-                # Get semantic diff if it's a code file
-                semantic_diff = self.get_semantic_diff(filepath)
+                # Semantic diff if it's a code file
+                semantic_diff = semantic_diffs.get(filepath)
                 if semantic_diff and "error" not in semantic_diff:
                     summary["semantic_changes"][filepath] = semantic_diff
                     summary["summary"]["code_files"] += 1
@@ -280,11 +553,18 @@ class GitHandler:
         """Stage files for commit"""
         try:
             if files:
-                cmd = ["git", "add"] + files
+                cmd = [_GIT, "add"] + files
             else:
-                cmd = ["git", "add", "."]
+                cmd = [_GIT, "add", "."]
 
-            subprocess.run(cmd, check=True, capture_output=True)
+            subprocess.run(
+                cmd,
+                check=True,
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
+            self._invalidate_status_cache()
             logger.info(f"Staged files: {files or 'all'}")
             return True
 
@@ -300,19 +580,29 @@ class GitHandler:
                 if not self.stage_files():
                     return False
 
-            # Check if there's anything to commit
-            status = self.get_git_status()
-            if (
-                not status.get("staged")
-                and not status.get("modified")
-                and not status.get("added")
-            ):
+            # Check if there's anything to commit - a single quiet diff
+            # against the index beats a full status parse here
+            check = subprocess.run(
+                [_GIT, "diff", "--cached", "--quiet"],
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
+            if check.returncode == 0:
                 logger.warning("No changes to commit")
                 return False
 
             # Create commit
-            cmd = ["git", "commit", "-m", message]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = [_GIT, "commit", "-m", message]
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
+            self._invalidate_status_cache()
 
             logger.info(f"✅ Commit created: {message}")
             logger.debug(f"Git output: {result.stdout}")
@@ -327,28 +617,40 @@ class GitHandler:
     def get_recent_commits(self, count: int = 5) -> List[Dict]:
         """Get recent commit history"""
         try:
+            # NUL field separators survive pipes in subjects; partition
+            # walks each record without building intermediate lists
             cmd = [
-                "git",
+                _GIT,
                 "log",
                 f"-{count}",
-                "--pretty=format:%H|%s|%an|%ad",
+                "--pretty=format:%H%x00%s%x00%an%x00%ad",
                 "--date=short",
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
 
             commits = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split("|")
-                    if len(parts) >= 4:
-                        commits.append(
-                            {
-                                "hash": parts[0],
-                                "message": parts[1],
-                                "author": parts[2],
-                                "date": parts[3],
-                            }
-                        )
+            for line in result.stdout.splitlines():
+                if not line:
+                    continue
+                commit_hash, _, rest = line.partition("\0")
+                message, _, rest = rest.partition("\0")
+                author, _, date = rest.partition("\0")
+                if date:
+                    commits.append(
+                        {
+                            "hash": commit_hash,
+                            "message": message,
+                            "author": author,
+                            "date": date,
+                        }
+                    )
 
             return commits
 
@@ -359,7 +661,12 @@ class GitHandler:
     def has_uncommitted_changes(self) -> bool:
         """Check if there are uncommitted changes"""
         try:
-            result = subprocess.run(["git", "diff", "--quiet"], capture_output=True)
+            result = subprocess.run(
+                [_GIT, "diff", "--quiet"],
+                capture_output=True,
+                stdin=subprocess.DEVNULL,
+                env=_GIT_ENV,
+            )
             # git diff --quiet returns 0 if no changes, 1 if changes exist
             return result.returncode != 0
         except subprocess.CalledProcessError:
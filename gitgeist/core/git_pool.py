@@ -0,0 +1,135 @@
+# gitgeist/core/git_pool.py
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from gitgeist.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Same child setup as git_handler - the full environment (GIT_DIR,
+# GIT_OBJECT_DIRECTORY, alternates and friends must reach object
+# reads too) with two overrides; the pool stands alone so git_handler
+# can import it without a cycle
+_GIT = shutil.which("git") or "git"
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+
+class GitProcPool:
+    """Pool of long-lived `git cat-file --batch` children, one per repo.
+
+    Forking git per object read dominates small lookups; keeping one
+    batch process alive per repository amortizes the exec cost across
+    every GitHandler in the process. Idle children are reaped so a big
+    multi-repo workspace doesn't accumulate zombies.
+    """
+
+    def __init__(self, idle_timeout: float = 60.0):
+        self.idle_timeout = idle_timeout
+        # key -> [proc, io_lock, last_used]; guarded by self._lock
+        self._procs: Dict[str, List] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(repo_path) -> str:
+        """Normalize a repo path (None means the process cwd) to a key"""
+        return str(Path(repo_path).resolve()) if repo_path else os.getcwd()
+
+    def _checkout(self, key: str):
+        """Get (or start) the child for a key; returns (proc, io_lock)"""
+        now = time.monotonic()
+        with self._lock:
+            self._reap_idle(now)
+
+            entry = self._procs.get(key)
+            if entry is None or entry[0].poll() is not None:
+                proc = subprocess.Popen(
+                    [_GIT, "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    cwd=key,
+                    env=_GIT_ENV,
+                )
+                entry = self._procs[key] = [proc, threading.Lock(), now]
+            else:
+                entry[2] = now
+
+            return entry[0], entry[1]
+
+    def read_object(self, ref: str, repo_path=None) -> Optional[str]:
+        """Read one object through the repo's batch pipe"""
+        key = self._key(repo_path)
+        try:
+            proc, io_lock = self._checkout(key)
+
+            # The pipe is a single request/response stream, so the
+            # write-header-payload sequence must not interleave
+            with io_lock:
+                proc.stdin.write(f"{ref}\n".encode())
+                proc.stdin.flush()
+
+                header = proc.stdout.readline().split()
+                if len(header) < 3 or header[1] != b"blob":
+                    # "<ref> missing" carries no payload, but a
+                    # tree/commit/tag does - drain it, or every later
+                    # response on this pipe is shifted by one request
+                    if len(header) >= 3 and header[2].isdigit():
+                        proc.stdout.read(int(header[2]) + 1)
+                    return None
+
+                size = int(header[2])
+                payload = proc.stdout.read(size + 1)[:size]  # trailing newline
+
+            return payload.decode("utf-8")
+
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            logger.error(f"cat-file read failed for {ref}: {e}")
+            self.close(repo_path)
+            return None
+
+    def _reap_idle(self, now: float) -> None:
+        """Terminate children idle past the timeout; caller holds _lock"""
+        for key, entry in list(self._procs.items()):
+            if now - entry[2] > self.idle_timeout:
+                del self._procs[key]
+                self._terminate(entry[0])
+
+    @staticmethod
+    def _terminate(proc) -> None:
+        try:
+            proc.stdin.close()
+            proc.terminate()
+        except OSError:
+            pass
+
+    def close(self, repo_path=None) -> None:
+        """Shut down the child for one repository, if running"""
+        key = self._key(repo_path)
+        with self._lock:
+            entry = self._procs.pop(key, None)
+        if entry is not None:
+            self._terminate(entry[0])
+
+    def close_all(self) -> None:
+        """Shut down every pooled child"""
+        with self._lock:
+            entries = list(self._procs.values())
+            self._procs.clear()
+        for entry in entries:
+            self._terminate(entry[0])
+
+    def __del__(self):
+        self.close_all()
+
+
+# Process-wide pool shared by all handlers
+_pool = GitProcPool()
+
+
+def get_git_pool() -> GitProcPool:
+    """Return the process-wide GitProcPool"""
+    return _pool
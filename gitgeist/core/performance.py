@@ -1,8 +1,9 @@
 # gitgeist/core/performance.py
 import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
-from functools import wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+from pathlib import Path
 from typing import Any, Callable, Dict, List
 
 from gitgeist.core.caching import CacheManager, FileAnalysisCache
@@ -10,6 +11,72 @@ from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Per-process cache instances for process-pool workers, keyed by cache dir
+_worker_caches: Dict[str, FileAnalysisCache] = {}
+
+# Shared parser instance; grammar loading is expensive so pay it once
+# per process (lazily, to keep module import cheap)
+_ast_parser = None
+
+
+def _get_ast_parser():
+    """Return the per-process GitgeistASTParser singleton"""
+    global _ast_parser
+    if _ast_parser is None:
+        from gitgeist.analysis.ast_parser import GitgeistASTParser
+        _ast_parser = GitgeistASTParser()
+    return _ast_parser
+
+
+def _analyze_one(file_path: str, cache_dir: str = None) -> Dict[str, Any]:
+    """Analyze one file; top-level so it pickles into worker processes"""
+    cache = _worker_caches.get(cache_dir)
+    if cache is None:
+        manager = CacheManager(Path(cache_dir)) if cache_dir else CacheManager()
+        cache = FileAnalysisCache(manager)
+        _worker_caches[cache_dir] = cache
+
+    file_hash = cache.get_file_hash(file_path)
+    if file_hash:
+        cached_result = cache.get_file_analysis(file_path, file_hash)
+        if cached_result:
+            return cached_result
+
+    result = _get_ast_parser().analyze_file_structure(file_path)
+
+    if file_hash and result and "error" not in result:
+        cache.set_file_analysis(file_path, file_hash, result)
+
+    return result
+
+
+def _process_batch(file_paths: List[str], processor_func: Callable) -> List[Any]:
+    """Process a batch of files; top-level so it works in process pools"""
+    results = []
+    for file_path in file_paths:
+        try:
+            result = processor_func(file_path)
+            results.append(result)
+        except Exception as e:
+            logger.error(f"Failed to process {file_path}: {e}")
+            results.append({"error": str(e), "file": file_path})
+
+    return results
+
+
+class _Metric:
+    """Per-operation counters; slots keep instances small and attribute
+    reads C-level instead of dict probes"""
+
+    __slots__ = ("calls", "total_time", "min_time", "max_time", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+        self.errors = 0
+
 
 class PerformanceMonitor:
     """Monitors and optimizes performance"""
@@ -22,74 +89,79 @@ class PerformanceMonitor:
         """Decorator to time function execution"""
         def decorator(func: Callable) -> Callable:
             name = func_name or f"{func.__module__}.{func.__name__}"
-            
+            # Bound once at decoration time so the per-call fast path
+            # does local loads instead of attribute lookups
+            _record = self._record_metric
+            _now = time.perf_counter
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = _now()
                 try:
                     result = func(*args, **kwargs)
-                    execution_time = time.time() - start_time
-                    self._record_metric(name, execution_time, "success")
+                    _record(name, _now() - start_time, "success")
                     return result
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    self._record_metric(name, execution_time, "error")
+                except Exception:
+                    _record(name, _now() - start_time, "error")
                     raise
-            
+
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = _now()
                 try:
                     result = await func(*args, **kwargs)
-                    execution_time = time.time() - start_time
-                    self._record_metric(name, execution_time, "success")
+                    _record(name, _now() - start_time, "success")
                     return result
-                except Exception as e:
-                    execution_time = time.time() - start_time
-                    self._record_metric(name, execution_time, "error")
+                except Exception:
+                    _record(name, _now() - start_time, "error")
                     raise
-            
+
             return async_wrapper if asyncio.iscoroutinefunction(func) else wrapper
         return decorator
 
     def _record_metric(self, name: str, execution_time: float, status: str):
         """Record performance metric"""
-        if name not in self.metrics:
-            self.metrics[name] = {
-                "calls": 0,
-                "total_time": 0,
-                "avg_time": 0,
-                "min_time": float('inf'),
-                "max_time": 0,
-                "errors": 0
-            }
-        
-        metric = self.metrics[name]
-        metric["calls"] += 1
-        metric["total_time"] += execution_time
-        metric["avg_time"] = metric["total_time"] / metric["calls"]
-        metric["min_time"] = min(metric["min_time"], execution_time)
-        metric["max_time"] = max(metric["max_time"], execution_time)
-        
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = _Metric()
+
+        metric.calls += 1
+        metric.total_time += execution_time
+        if execution_time < metric.min_time:
+            metric.min_time = execution_time
+        if execution_time > metric.max_time:
+            metric.max_time = execution_time
+
         if status == "error":
-            metric["errors"] += 1
-        
+            metric.errors += 1
+
         # Log slow operations
         if execution_time > 2.0:
             logger.warning(f"Slow operation: {name} took {execution_time:.2f}s")
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get performance metrics"""
-        return self.metrics.copy()
+        # avg_time is derived on read; it isn't worth a write per call
+        return {
+            name: {
+                "calls": m.calls,
+                "total_time": m.total_time,
+                "avg_time": m.total_time / m.calls,
+                "min_time": m.min_time,
+                "max_time": m.max_time,
+                "errors": m.errors,
+            }
+            for name, m in self.metrics.items()
+        }
 
     def get_slowest_operations(self, limit: int = 5) -> List[Dict]:
         """Get slowest operations"""
         sorted_metrics = sorted(
-            self.metrics.items(),
+            self.get_metrics().items(),
             key=lambda x: x[1]["avg_time"],
             reverse=True
         )
-        
+
         return [
             {"name": name, **metrics}
             for name, metrics in sorted_metrics[:limit]
@@ -99,9 +171,14 @@ class PerformanceMonitor:
 class BatchProcessor:
     """Processes operations in batches for better performance"""
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, use_processes: bool = True):
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # AST parsing is GIL-bound Python work, so real scaling needs
+        # processes; threads remain available for I/O-bound callers
+        if use_processes:
+            self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
     async def process_files_batch(self, file_paths: List[str], 
                                  processor_func: Callable) -> List[Any]:
@@ -109,21 +186,22 @@ class BatchProcessor:
         if not file_paths:
             return []
         
-        # Split into batches
-        batch_size = max(1, len(file_paths) // self.max_workers)
+        # Split into batches, capped so skewed file sizes still balance
+        batch_size = min(32, max(1, len(file_paths) // self.max_workers))
         batches = [
             file_paths[i:i + batch_size]
             for i in range(0, len(file_paths), batch_size)
         ]
         
-        # Process batches in parallel
-        loop = asyncio.get_event_loop()
+        # Process batches in parallel; get_event_loop is deprecated
+        # outside a running loop and gone in newer Pythons
+        loop = asyncio.get_running_loop()
         tasks = []
         
         for batch in batches:
             task = loop.run_in_executor(
                 self.executor,
-                self._process_batch,
+                _process_batch,
                 batch,
                 processor_func
             )
@@ -138,23 +216,9 @@ class BatchProcessor:
         
         return results
 
-    def _process_batch(self, file_paths: List[str], processor_func: Callable) -> List[Any]:
-        """Process a batch of files"""
-        results = []
-        for file_path in file_paths:
-            try:
-                result = processor_func(file_path)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to process {file_path}: {e}")
-                results.append({"error": str(e), "file": file_path})
-        
-        return results
-
-    def __del__(self):
-        """Cleanup executor"""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
+    def close(self):
+        """Shut the worker pool down; safe to call more than once"""
+        self.executor.shutdown(wait=False)
 
 
 class OptimizedAnalyzer:
@@ -165,27 +229,37 @@ class OptimizedAnalyzer:
         self.batch_processor = BatchProcessor()
         self.monitor = PerformanceMonitor()
 
-    @PerformanceMonitor().time_function("analyze_file_optimized")
     def analyze_file_optimized(self, file_path: str) -> Dict[str, Any]:
         """Analyze file with caching optimization"""
-        # Check cache first
-        file_hash = self.cache.get_file_hash(file_path)
-        if file_hash:
-            cached_result = self.cache.get_file_analysis(file_path, file_hash)
-            if cached_result:
-                logger.debug(f"Cache hit for {file_path}")
-                return cached_result
-        
-        # Perform analysis
-        from gitgeist.analysis.ast_parser import GitgeistASTParser
-        parser = GitgeistASTParser()
-        result = parser.analyze_file_structure(file_path)
-        
-        # Cache result
-        if file_hash and result and "error" not in result:
-            self.cache.set_file_analysis(file_path, file_hash, result)
-        
-        return result
+        # Timed against self.monitor directly; the old class-body
+        # @PerformanceMonitor().time_function decorator recorded into a
+        # throwaway monitor instance, silently discarding every metric
+        start_time = time.perf_counter()
+        status = "success"
+        try:
+            # Check cache first
+            file_hash = self.cache.get_file_hash(file_path)
+            if file_hash:
+                cached_result = self.cache.get_file_analysis(file_path, file_hash)
+                if cached_result:
+                    logger.debug(f"Cache hit for {file_path}")
+                    return cached_result
+
+            # Perform analysis
+            result = _get_ast_parser().analyze_file_structure(file_path)
+
+            # Cache result
+            if file_hash and result and "error" not in result:
+                self.cache.set_file_analysis(file_path, file_hash, result)
+
+            return result
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self.monitor._record_metric(
+                "analyze_file_optimized", time.perf_counter() - start_time, status
+            )
 
     async def analyze_files_batch(self, file_paths: List[str]) -> List[Dict[str, Any]]:
         """Analyze multiple files with optimization"""
@@ -208,9 +282,11 @@ class OptimizedAnalyzer:
         
         # Process uncached files in batches
         if uncached_files:
+            # _analyze_one is a free function so it can cross the process
+            # boundary; each worker re-opens the cache in its own process
             batch_results = await self.batch_processor.process_files_batch(
                 uncached_files,
-                self.analyze_file_optimized
+                partial(_analyze_one, cache_dir=str(self.cache.cache.cache_dir))
             )
             
             # Combine results
@@ -1,8 +1,10 @@
 # gitgeist/core/schema.py
-import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+import fastjsonschema
+import orjson
+
 GITGEIST_SCHEMA = {
     "type": "object",
     "properties": {
@@ -19,7 +21,13 @@ GITGEIST_SCHEMA = {
         "supported_languages": {"type": "array", "items": {"type": "string"}},
         "autonomous_mode": {"type": "boolean"},
         "require_confirmation": {"type": "boolean"},
-        "max_commit_frequency": {"type": "integer", "minimum": 1},
+        # "not boolean" guards against bool passing the integer check
+        # (bool is an int subclass)
+        "max_commit_frequency": {
+            "type": "integer",
+            "minimum": 1,
+            "not": {"type": "boolean"},
+        },
         "data_dir": {"type": "string"},
         "log_file": {"type": "string"},
         "log_level": {
@@ -32,64 +40,32 @@ GITGEIST_SCHEMA = {
 }
 
 
-def validate_config(config_data: Dict[str, Any]) -> List[str]:
-    """Validate configuration against schema. Returns list of errors."""
-    errors = []
-
-    # Check required fields
-    for field in GITGEIST_SCHEMA["required"]:
-        if field not in config_data:
-            errors.append(f"Missing required field: {field}")
+# Compiled once at import time; fastjsonschema generates a straight-line
+# validator function instead of walking the schema dict per call
+_VALIDATE = fastjsonschema.compile(GITGEIST_SCHEMA)
 
-    # Check field types and values
-    for field, value in config_data.items():
-        if field not in GITGEIST_SCHEMA["properties"]:
-            errors.append(f"Unknown field: {field}")
-            continue
+# Hoisted so the per-call pre-check doesn't re-walk the schema dict
+_REQUIRED_FIELDS = tuple(GITGEIST_SCHEMA["required"])
 
-        field_schema = GITGEIST_SCHEMA["properties"][field]
 
-        # Type validation
-        if field_schema["type"] == "boolean" and not isinstance(value, bool):
-            errors.append(
-                f"Field '{field}' must be boolean, got {type(value).__name__}"
-            )
-        elif field_schema["type"] == "string" and not isinstance(value, str):
-            errors.append(f"Field '{field}' must be string, got {type(value).__name__}")
-        elif field_schema["type"] == "number" and not isinstance(value, (int, float)):
-            errors.append(f"Field '{field}' must be number, got {type(value).__name__}")
-        elif field_schema["type"] == "integer" and not isinstance(value, int):
-            errors.append(
-                f"Field '{field}' must be integer, got {type(value).__name__}"
-            )
-        elif field_schema["type"] == "array" and not isinstance(value, list):
-            errors.append(f"Field '{field}' must be array, got {type(value).__name__}")
-
-        # Enum validation
-        if "enum" in field_schema and value not in field_schema["enum"]:
-            errors.append(
-                f"Field '{field}' must be one of {field_schema['enum']}, got '{value}'"
-            )
+def validate_config(config_data: Dict[str, Any]) -> List[str]:
+    """Validate configuration against schema. Returns list of errors."""
+    # Report all missing required fields up front (the compiled validator
+    # stops at the first failure)
+    errors = [
+        f"Missing required field: {field}"
+        for field in _REQUIRED_FIELDS
+        if field not in config_data
+    ]
+    if errors:
+        return errors
 
-        # Range validation
-        if (
-            "minimum" in field_schema
-            and isinstance(value, (int, float))
-            and value < field_schema["minimum"]
-        ):
-            errors.append(
-                f"Field '{field}' must be >= {field_schema['minimum']}, got {value}"
-            )
-        if (
-            "maximum" in field_schema
-            and isinstance(value, (int, float))
-            and value > field_schema["maximum"]
-        ):
-            errors.append(
-                f"Field '{field}' must be <= {field_schema['maximum']}, got {value}"
-            )
+    try:
+        _VALIDATE(config_data)
+    except fastjsonschema.JsonSchemaException as e:
+        return [e.message]
 
-    return errors
+    return []
 
 
 def validate_config_file(config_path: Path) -> List[str]:
@@ -98,9 +74,8 @@ def validate_config_file(config_path: Path) -> List[str]:
         return [f"Configuration file not found: {config_path}"]
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
-    except json.JSONDecodeError as e:
+        config_data = orjson.loads(config_path.read_bytes())
+    except orjson.JSONDecodeError as e:
         return [f"Invalid JSON in configuration file: {e}"]
     except Exception as e:
         return [f"Error reading configuration file: {e}"]
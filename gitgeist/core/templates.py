@@ -1,10 +1,62 @@
 # gitgeist/core/templates.py
+import re
 from typing import Dict, List, Optional
 
 from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Whitespace normalization without the split-into-list round trip
+_WS_RE = re.compile(r"\s+")
+
+
+# Scope inference tables, built once: directory components, exact
+# basenames and basename affixes each resolve with one dict lookup per
+# path part instead of a substring scan per pattern per file
+_SCOPE_DIR_COMPONENTS = {
+    "api": "api",
+    "routes": "api",
+    "endpoints": "api",
+    "auth": "auth",
+    "login": "auth",
+    "authentication": "auth",
+    "database": "db",
+    "models": "db",
+    "migrations": "db",
+    "ui": "ui",
+    "components": "ui",
+    "views": "ui",
+    "core": "core",
+    "lib": "core",
+    "utils": "core",
+    "config": "config",
+    "settings": "config",
+    "docs": "docs",
+    "test": "tests",
+    "tests": "tests",
+    "spec": "tests",
+    ".github": "ci",
+    "ci": "ci",
+    "pipeline": "ci",
+}
+
+_SCOPE_BASENAMES = {
+    "package.json": "deps",
+    "requirements.txt": "deps",
+    "cargo.toml": "deps",
+}
+
+# Commit-type inference as a priority-ordered decision table: the first
+# rule whose keys carry anything wins
+_INFER_RULES = (
+    ("feature", ("functions_added", "classes_added", "new_files")),
+    ("fix", ("functions_removed", "bug_fixes")),
+    ("refactor", ("functions_modified", "classes_modified", "code_restructured")),
+    ("docs", ("doc_files",)),
+    ("test", ("test_files",)),
+    ("chore", ("config_files",)),
+)
+
 
 class CommitTemplateManager:
     """Manages commit message templates and formatting"""
@@ -51,70 +103,63 @@ class CommitTemplateManager:
                 "revert": "{description}"
             }
         }
+        # Flat (style, type) -> template mirror of the nested dict; one
+        # hash lookup per resolution step instead of membership test
+        # plus nested indexing
+        self._flat = {
+            (style, commit_type): template
+            for style, table in self.templates.items()
+            for commit_type, template in table.items()
+        }
+        # (style, type) -> resolved template memo for get_template
+        self._template_cache: Dict = {}
+        # (style, type) -> (with_scope, no_scope) format strings
+        self._format_cache: Dict = {}
 
     def get_template(self, style: str, commit_type: str) -> Optional[str]:
         """Get commit template for style and type"""
-        if style not in self.templates:
-            style = "conventional"
-        
-        if commit_type not in self.templates[style]:
-            commit_type = "feature"
-        
-        return self.templates[style][commit_type]
+        # Bursty auto-commits resolve the same few (style, type) pairs
+        # over and over; memoize past the fallback branches
+        key = (style, commit_type)
+        template = self._template_cache.get(key)
+        if template is None:
+            flat = self._flat
+            template = (
+                flat.get(key)
+                or flat.get((style, "feature"))
+                or flat.get(("conventional", commit_type))
+                or flat[("conventional", "feature")]
+            )
+            self._template_cache[key] = template
+
+        return template
 
     def format_commit_message(self, style: str, commit_type: str, 
                             description: str, scope: str = None) -> str:
         """Format commit message using template"""
-        template = self.get_template(style, commit_type)
-        
-        # Handle scope
-        if "{scope}" in template:
-            if scope:
-                template = template.replace("{scope}", scope)
-            else:
-                # Remove scope if not provided
-                template = template.replace("({scope})", "").replace("{scope}", "")
-        
-        # Replace description
-        message = template.replace("{description}", description)
-        
+        # The templates already use str.format placeholders, so both
+        # scope variants are prepared once and each call is a single
+        # C-level format instead of chained replaces
+        key = (style, commit_type)
+        formats = self._format_cache.get(key)
+        if formats is None:
+            template = self.get_template(style, commit_type)
+            no_scope = template.replace("({scope})", "").replace("{scope}", "")
+            self._format_cache[key] = formats = (template, no_scope)
+
+        fmt = formats[0] if scope else formats[1]
+        message = fmt.format(scope=scope or "", description=description)
+
         # Clean up extra spaces
-        message = " ".join(message.split())
-        
-        return message
+        return _WS_RE.sub(" ", message).strip()
 
     def infer_commit_type(self, changes: Dict) -> str:
         """Infer commit type from semantic changes"""
-        # Check for new features
-        if (changes.get("functions_added") or 
-            changes.get("classes_added") or
-            changes.get("new_files")):
-            return "feature"
-        
-        # Check for fixes
-        if (changes.get("functions_removed") or 
-            changes.get("bug_fixes") or
-            "fix" in str(changes).lower()):
-            return "fix"
-        
-        # Check for refactoring
-        if (changes.get("functions_modified") or 
-            changes.get("classes_modified") or
-            changes.get("code_restructured")):
-            return "refactor"
-        
-        # Check for documentation
-        if changes.get("doc_files") or "docs" in str(changes).lower():
-            return "docs"
-        
-        # Check for tests
-        if changes.get("test_files") or "test" in str(changes).lower():
-            return "test"
-        
-        # Check for configuration
-        if changes.get("config_files"):
-            return "chore"
-        
+        get = changes.get
+        for commit_type, keys in _INFER_RULES:
+            if any(get(key) for key in keys):
+                return commit_type
+
         # Default to feature
         return "feature"
 
@@ -122,29 +167,30 @@ class CommitTemplateManager:
         """Infer scope from changed files"""
         if not files_changed:
             return None
-        
-        # Common scope patterns
-        scope_patterns = {
-            "api": ["api/", "routes/", "endpoints/"],
-            "auth": ["auth/", "login/", "authentication/"],
-            "db": ["database/", "models/", "migrations/"],
-            "ui": ["ui/", "components/", "views/"],
-            "core": ["core/", "lib/", "utils/"],
-            "config": ["config/", "settings/", ".env"],
-            "docs": ["docs/", "README", ".md"],
-            "tests": ["test/", "tests/", "spec/"],
-            "ci": [".github/", "ci/", "pipeline/"],
-            "deps": ["package.json", "requirements.txt", "Cargo.toml"]
-        }
-        
-        # Count matches for each scope
+
+        # One pass per file: each directory component and the basename
+        # resolve against the prebuilt tables
         scope_counts = {}
         for file_path in files_changed:
-            file_lower = file_path.lower()
-            for scope, patterns in scope_patterns.items():
-                for pattern in patterns:
-                    if pattern in file_lower:
-                        scope_counts[scope] = scope_counts.get(scope, 0) + 1
+            parts = file_path.lower().split("/")
+            hits = set()
+
+            for part in parts[:-1]:
+                scope = _SCOPE_DIR_COMPONENTS.get(part)
+                if scope:
+                    hits.add(scope)
+
+            basename = parts[-1]
+            scope = _SCOPE_BASENAMES.get(basename)
+            if scope:
+                hits.add(scope)
+            if basename.startswith("readme") or basename.endswith(".md"):
+                hits.add("docs")
+            if basename.startswith(".env"):
+                hits.add("config")
+
+            for scope in hits:
+                scope_counts[scope] = scope_counts.get(scope, 0) + 1
         
         # Return most common scope
         if scope_counts:
@@ -164,45 +210,39 @@ class CommitTemplateManager:
 
     def generate_description(self, changes: Dict, files_changed: List[str]) -> str:
         """Generate commit description from changes"""
-        descriptions = []
-        
+        # Only the first matching description is ever used, so bind the
+        # lists once and return directly instead of building them all
+        functions_added = changes.get("functions_added") or ()
+        functions_removed = changes.get("functions_removed") or ()
+        functions_modified = changes.get("functions_modified") or ()
+        classes_added = changes.get("classes_added") or ()
+
         # Functions
-        if changes.get("functions_added"):
-            count = len(changes["functions_added"])
-            if count == 1:
-                descriptions.append(f"add {changes['functions_added'][0]} function")
-            else:
-                descriptions.append(f"add {count} new functions")
-        
-        if changes.get("functions_removed"):
-            count = len(changes["functions_removed"])
-            descriptions.append(f"remove {count} functions")
-        
-        if changes.get("functions_modified"):
-            count = len(changes["functions_modified"])
-            descriptions.append(f"update {count} functions")
-        
+        if functions_added:
+            if len(functions_added) == 1:
+                return f"add {functions_added[0]} function"
+            return f"add {len(functions_added)} new functions"
+
+        if functions_removed:
+            return f"remove {len(functions_removed)} functions"
+
+        if functions_modified:
+            return f"update {len(functions_modified)} functions"
+
         # Classes
-        if changes.get("classes_added"):
-            count = len(changes["classes_added"])
-            if count == 1:
-                descriptions.append(f"add {changes['classes_added'][0]} class")
-            else:
-                descriptions.append(f"add {count} new classes")
-        
+        if classes_added:
+            if len(classes_added) == 1:
+                return f"add {classes_added[0]} class"
+            return f"add {len(classes_added)} new classes"
+
         # Files
-        if not descriptions and files_changed:
-            file_count = len(files_changed)
-            if file_count == 1:
-                descriptions.append(f"update {files_changed[0]}")
-            else:
-                descriptions.append(f"update {file_count} files")
-        
+        if files_changed:
+            if len(files_changed) == 1:
+                return f"update {files_changed[0]}"
+            return f"update {len(files_changed)} files"
+
         # Default
-        if not descriptions:
-            descriptions.append("update code")
-        
-        return descriptions[0]
+        return "update code"
 
     def create_commit_message(self, style: str, changes: Dict, 
                             files_changed: List[str]) -> str:
@@ -219,6 +259,10 @@ class CommitTemplateManager:
             self.templates[style] = {}
         
         self.templates[style].update(templates)
+        for commit_type, template in templates.items():
+            self._flat[(style, commit_type)] = template
+        self._template_cache.clear()
+        self._format_cache.clear()
         logger.info(f"Added custom templates for style: {style}")
 
     def get_available_styles(self) -> List[str]:
@@ -5,6 +5,15 @@ from typing import Dict, List, Optional
 
 from gitgeist.utils.exceptions import ValidationError
 
+# Compiled once; validate_host_url sits on the config-load hot path
+_HOST_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 class ConfigValidator:
     """Validates configuration values"""
@@ -24,15 +33,7 @@ class ConfigValidator:
         if not host or not isinstance(host, str):
             raise ValidationError("Host URL must be a non-empty string")
         
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(host):
+        if not _HOST_URL_RE.match(host):
             raise ValidationError(
                 f"Invalid host URL: {host}",
                 "Use format: http://localhost:11434"
@@ -125,24 +126,20 @@ class SystemValidator:
     @staticmethod
     def validate_dependencies() -> List[str]:
         """Check for missing dependencies"""
-        missing = []
-        
-        try:
-            import tree_sitter
-        except ImportError:
-            missing.append("tree-sitter")
-        
-        try:
-            import sentence_transformers
-        except ImportError:
-            missing.append("sentence-transformers")
-        
-        try:
-            import aiohttp
-        except ImportError:
-            missing.append("aiohttp")
-        
-        return missing
+        import importlib.util
+
+        # find_spec answers "is it installed" without executing the
+        # module; importing sentence_transformers alone drags in torch
+        checks = [
+            ("tree_sitter", "tree-sitter"),
+            ("sentence_transformers", "sentence-transformers"),
+            ("aiohttp", "aiohttp"),
+        ]
+        return [
+            package
+            for module, package in checks
+            if importlib.util.find_spec(module) is None
+        ]
 
     @staticmethod
     def validate_disk_space(required_mb: int = 100) -> None:
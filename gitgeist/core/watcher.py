@@ -1,9 +1,14 @@
 # gitgeist/core/watcher.py - Enhanced file watcher with semantic analysis
 
 import asyncio
+import functools
+import hashlib
+import os
+import re
+import signal
+import sys
 import time
-from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List
 
 from watchdog.events import (
     FileCreatedEvent,
@@ -13,13 +18,92 @@ from watchdog.events import (
 )
 from watchdog.observers import Observer
 
-from gitgeist.ai.commit_generator import CommitGenerator
-from gitgeist.analysis.ast_parser import GitgeistASTParser
 from gitgeist.core.config import GitgeistConfig
 from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cap on coalesced pending changes; past this the watcher is seeing a
+# bulk operation the next commit pass will pick up from git anyway
+_MAX_PENDING_CHANGES = 10_000
+
+
+def _translate_ignore_pattern(pattern: str) -> str:
+    """Turn one glob ignore pattern into a path-aware regex fragment"""
+    parts = []
+    for ch in pattern:
+        if ch == "*":
+            parts.append(r"[^/]*")
+        elif ch == "?":
+            parts.append(r"[^/]")
+        else:
+            parts.append(re.escape(ch))
+    # Anchor on component boundaries so ".git/*" also covers deeper
+    # children and ".env" only matches a whole component
+    return r"(?:^|/)" + "".join(parts) + r"(?:/|$)"
+
+
+def _compile_ignore_patterns(patterns: List[str]):
+    """Compile all ignore patterns into one combined regex (or None)"""
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{_translate_ignore_pattern(p)})" for p in patterns)
+    )
+
+
+class _IgnoreMatcher:
+    """Matches ignore patterns via a component trie plus a glob fallback
+
+    Literal patterns (".git/*", ".env", "data/logs/*") go into a trie
+    keyed on path components, so a path is checked in one descent per
+    component instead of one scan per pattern; only genuinely globby
+    patterns ("*.pyc") fall through to the combined regex.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self._trie: Dict = {}
+        # Watchdog fires the same paths over and over, so verdicts are
+        # memoized; patterns never change after construction
+        self.match = functools.lru_cache(maxsize=4096)(self._match)
+        globs = []
+        for pattern in patterns or []:
+            components = pattern.rstrip("/").split("/")
+            if components and components[-1] == "*":
+                # "dir/*" ignores everything under dir
+                components = components[:-1]
+            if not components or any(
+                "*" in c or "?" in c or "[" in c for c in components
+            ):
+                globs.append(pattern)
+                continue
+            node = self._trie
+            for component in components:
+                node = node.setdefault(component, {})
+            node[None] = True  # terminal marker
+
+        self._glob_re = _compile_ignore_patterns(globs)
+
+    def _match(self, filepath: str) -> bool:
+        """Check filepath against all patterns"""
+        trie = self._trie
+        if trie:
+            parts = filepath.split("/")
+            for start in range(len(parts)):
+                node = trie.get(parts[start])
+                index = start
+                while node is not None:
+                    if None in node:
+                        return True
+                    index += 1
+                    if index >= len(parts):
+                        break
+                    node = node.get(parts[index])
+
+        if self._glob_re is not None and self._glob_re.search(filepath):
+            return True
+        return False
+
 
 class GitgeistFileHandler(FileSystemEventHandler):
     """Enhanced file system event handler with semantic analysis"""
@@ -27,27 +111,54 @@ class GitgeistFileHandler(FileSystemEventHandler):
     def __init__(self, config: GitgeistConfig, loop=None):
         super().__init__()
         self.config = config
-        self.ast_parser = GitgeistASTParser()
-        self.commit_generator = CommitGenerator(config)
+        # Built on first use: grammar loading and the LLM/memory stack
+        # are wasted cost for handlers that never see a code event
+        self._ast_parser = None
+        self._commit_generator = None
         self._loop = loop
 
-        # Debouncing
-        self.pending_changes: Set[str] = set()
-        self.last_change_time = time.time()
+        # Debouncing; maps path -> last seen event type so a save storm
+        # coalesces into one pending entry per file
+        self.pending_changes: Dict[str, str] = {}
         self.debounce_delay = 5.0  # seconds
+        # Monotonic deadline pushed forward by each event; immune to
+        # wall-clock jumps and cheap to extend
+        self._deadline = 0.0
+        # One waiter services a whole event burst; without this every
+        # save storm scheduled its own sleeping coroutine
+        self._check_scheduled = False
 
         # Change tracking
         self.file_snapshots: Dict[str, Dict] = {}
+        # Last analyzed content hash per path; editors often touch-
+        # write files, and identical bytes don't need a re-parse
+        self._content_hashes: Dict[str, str] = {}
 
-    def should_ignore(self, filepath: str) -> bool:
-        """Check if file should be ignored based on patterns"""
-        path = Path(filepath)
+        # Pattern compilation is amortized to init: literal patterns
+        # land in a component trie, the rest in one combined regex
+        self._ignore = _IgnoreMatcher(config.ignore_patterns)
 
-        for pattern in self.config.ignore_patterns:
-            if path.match(pattern.replace("*", "**")):
-                return True
+    @property
+    def ast_parser(self):
+        """Lazily constructed tree-sitter parser"""
+        if self._ast_parser is None:
+            from gitgeist.analysis.ast_parser import GitgeistASTParser
 
-        return False
+            self._ast_parser = GitgeistASTParser()
+        return self._ast_parser
+
+    @property
+    def commit_generator(self):
+        """Lazily constructed commit generator"""
+        if self._commit_generator is None:
+            from gitgeist.ai.commit_generator import CommitGenerator
+
+            self._commit_generator = CommitGenerator(self.config)
+        return self._commit_generator
+
+    def should_ignore(self, filepath: str) -> bool:
+        """Check if file should be ignored based on patterns"""
+        return self._ignore.match(filepath)
 
     def analyze_file_change(self, filepath: str, event_type: str) -> Dict:
         """Analyze what changed in a file using AST"""
@@ -69,23 +180,44 @@ class GitgeistFileHandler(FileSystemEventHandler):
             if language:
                 analysis["language"] = language
 
+                # Skip the tree-sitter parse when the bytes are
+                # identical to what the current snapshot was built from
+                content_hash = None
+                try:
+                    with open(filepath, "rb") as f:
+                        content_hash = hashlib.blake2b(
+                            f.read(), digest_size=16
+                        ).hexdigest()
+                except OSError:
+                    pass
+
+                if (
+                    content_hash is not None
+                    and self._content_hashes.get(filepath) == content_hash
+                ):
+                    analysis["unchanged"] = True
+                    return analysis
+
                 # Get current file structure
                 current_structure = self.ast_parser.analyze_file_structure(filepath)
+                snapshot = (
+                    self._snapshot_structure(current_structure)
+                    if current_structure
+                    else None
+                )
 
                 # Compare with previous snapshot if available
-                if filepath in self.file_snapshots:
-                    old_structure = self.file_snapshots[filepath]
-
-                    # Semantic diff
-                    if current_structure and old_structure:
-                        semantic_diff = self._compare_structures(
-                            old_structure, current_structure
+                if snapshot:
+                    old_snapshot = self.file_snapshots.get(filepath)
+                    if old_snapshot:
+                        analysis["semantic_changes"] = self._compare_structures(
+                            old_snapshot, snapshot
                         )
-                        analysis["semantic_changes"] = semantic_diff
 
-                # Update snapshot
-                if current_structure:
-                    self.file_snapshots[filepath] = current_structure
+                    # Only the compact form is retained per file
+                    self.file_snapshots[filepath] = snapshot
+                    if content_hash is not None:
+                        self._content_hashes[filepath] = content_hash
 
         except Exception as e:
             logger.error(f"Error analyzing {filepath}: {e}")
@@ -93,47 +225,47 @@ class GitgeistFileHandler(FileSystemEventHandler):
 
         return analysis
 
+    @staticmethod
+    def _snapshot_structure(structure: Dict) -> Dict:
+        """Reduce AST output to the compact form comparisons consume
+
+        Per tracked file this keeps one str->int dict (whose keys view
+        doubles as the function-name set) and two frozensets instead of
+        the full lists-of-dicts from the parser; interned names make
+        the set diffs between snapshots compare by identity.
+        """
+        return {
+            "function_starts": {
+                sys.intern(f["name"]): f["start_line"]
+                for f in structure.get("functions", [])
+            },
+            "class_names": frozenset(
+                sys.intern(c["name"]) for c in structure.get("classes", [])
+            ),
+            "import_statements": frozenset(
+                sys.intern(i["statement"]) for i in structure.get("imports", [])
+            ),
+        }
+
     def _compare_structures(self, old: Dict, new: Dict) -> Dict:
-        """Compare two file structures for semantic changes"""
+        """Compare two snapshot structures for semantic changes"""
+        old_funcs, new_funcs = old["function_starts"], new["function_starts"]
+        old_names, new_names = old_funcs.keys(), new_funcs.keys()
+
         changes = {
-            "functions_added": [],
-            "functions_removed": [],
+            "functions_added": list(new_names - old_names),
+            "functions_removed": list(old_names - new_names),
             "functions_modified": [],
-            "classes_added": [],
-            "classes_removed": [],
-            "imports_changed": False,
+            "classes_added": list(new["class_names"] - old["class_names"]),
+            "classes_removed": list(old["class_names"] - new["class_names"]),
+            "imports_changed": old["import_statements"] != new["import_statements"],
         }
 
-        # Compare functions
-        old_funcs = {f["name"]: f for f in old.get("functions", [])}
-        new_funcs = {f["name"]: f for f in new.get("functions", [])}
-
-        changes["functions_added"] = list(set(new_funcs.keys()) - set(old_funcs.keys()))
-        changes["functions_removed"] = list(
-            set(old_funcs.keys()) - set(new_funcs.keys())
-        )
-
         # Check for modified functions (line number changes as proxy)
-        for name in set(old_funcs.keys()) & set(new_funcs.keys()):
-            if old_funcs[name]["start_line"] != new_funcs[name]["start_line"]:
+        for name in old_names & new_names:
+            if old_funcs[name] != new_funcs[name]:
                 changes["functions_modified"].append(name)
 
-        # Compare classes
-        old_classes = {c["name"]: c for c in old.get("classes", [])}
-        new_classes = {c["name"]: c for c in new.get("classes", [])}
-
-        changes["classes_added"] = list(
-            set(new_classes.keys()) - set(old_classes.keys())
-        )
-        changes["classes_removed"] = list(
-            set(old_classes.keys()) - set(new_classes.keys())
-        )
-
-        # Compare imports (simple check)
-        old_imports = set(i["statement"] for i in old.get("imports", []))
-        new_imports = set(i["statement"] for i in new.get("imports", []))
-        changes["imports_changed"] = old_imports != new_imports
-
         return changes
 
     def on_modified(self, event):
@@ -150,25 +282,39 @@ class GitgeistFileHandler(FileSystemEventHandler):
             # Remove from snapshots
             if event.src_path in self.file_snapshots:
                 del self.file_snapshots[event.src_path]
+            self._content_hashes.pop(event.src_path, None)
 
     def _handle_file_change(self, filepath: str, event_type: str):
         """Handle individual file changes with debouncing"""
-        self.pending_changes.add(filepath)
-        self.last_change_time = time.time()
+        # The callback only records the event; the expensive AST
+        # analysis runs once per path in the debounced commit step, so
+        # N events per save no longer mean N parses
+        if self.should_ignore(filepath):
+            return
 
-        logger.info(f"File {event_type}: {filepath}")
+        # Re-insert so dict order tracks recency, and evict the stalest
+        # entry once the bulk-operation cap is hit
+        self.pending_changes.pop(filepath, None)
+        self.pending_changes[filepath] = event_type
+        if len(self.pending_changes) > _MAX_PENDING_CHANGES:
+            self.pending_changes.pop(next(iter(self.pending_changes)))
+        self._deadline = time.monotonic() + self.debounce_delay
 
-        # Immediate analysis for logging
-        analysis = self.analyze_file_change(filepath, event_type)
-        if not analysis.get("ignored") and analysis.get("semantic_changes"):
-            logger.info(f"Semantic changes detected: {analysis['semantic_changes']}")
+        logger.info(f"File {event_type}: {filepath}")
 
-        # Only schedule async operations if we have an event loop
+        # Only schedule async operations if we have an event loop, and
+        # only one commit check at a time; later events just push the
+        # deadline the in-flight waiter already watches
         if hasattr(self, "_loop") and self._loop and self.config.autonomous_mode:
-            try:
-                asyncio.run_coroutine_threadsafe(self._check_for_commit(), self._loop)
-            except Exception as e:
-                logger.error(f"Failed to schedule commit check: {e}")
+            if not self._check_scheduled:
+                self._check_scheduled = True
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        self._check_for_commit(), self._loop
+                    )
+                except Exception as e:
+                    self._check_scheduled = False
+                    logger.error(f"Failed to schedule commit check: {e}")
         else:
             # In sync mode, just log the changes
             logger.info(
@@ -177,26 +323,52 @@ class GitgeistFileHandler(FileSystemEventHandler):
 
     async def _check_for_commit(self):
         """Check if we should create a commit after debounce delay"""
-        await asyncio.sleep(self.debounce_delay)
+        # Sleep until the deadline, re-checking after each wake-up so
+        # the whole burst collapses into one commit pass
+        try:
+            while True:
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(remaining)
+        finally:
+            # Events arriving from here on need a fresh waiter
+            self._check_scheduled = False
 
-        # Check if enough time has passed since last change
-        if time.time() - self.last_change_time >= self.debounce_delay:
-            if self.pending_changes and self.config.auto_commit:
-                await self._create_commit()
+        if self.pending_changes and self.config.auto_commit:
+            await self._create_commit()
 
-            self.pending_changes.clear()
+        self.pending_changes.clear()
 
     async def _create_commit(self):
         """Create an intelligent commit based on accumulated changes"""
         try:
             logger.info("Creating AI-generated commit...")
 
-            # Analyze all pending changes
-            change_analyses = []
-            for filepath in self.pending_changes:
-                analysis = self.analyze_file_change(filepath, "batch_commit")
-                if not analysis.get("ignored"):
-                    change_analyses.append(analysis)
+            # Analyze all pending changes, one parse per coalesced
+            # path. The GIL is held during tree-sitter parses, so the
+            # overlap on executor threads comes from the file reads and
+            # hashing around them; the semaphore caps thread pressure
+            loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(max(2, os.cpu_count() or 2))
+
+            async def analyze_one(filepath, event_type):
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        None, self.analyze_file_change, filepath, event_type
+                    )
+
+            analyses = await asyncio.gather(
+                *(
+                    analyze_one(filepath, event_type)
+                    for filepath, event_type in list(self.pending_changes.items())
+                )
+            )
+            change_analyses = [
+                analysis
+                for analysis in analyses
+                if not analysis.get("ignored") and not analysis.get("unchanged")
+            ]
 
             if not change_analyses:
                 logger.info("No significant changes to commit")
@@ -231,6 +403,8 @@ class GitgeistWatcher:
         self.observer = Observer()
         self.handler = GitgeistFileHandler(config)
         self.is_running = False
+        self._stop_event = None
+        self._loop = None
 
     def start(self):
         """Start watching (synchronous)"""
@@ -249,32 +423,59 @@ class GitgeistWatcher:
         logger.info(f"🧠 Gitgeist watching: {self.config.watch_paths}")
 
         try:
-            while self.is_running:
-                time.sleep(1)
+            # Block on the observer thread instead of a once-per-second
+            # wake-up loop; Ctrl-C still interrupts the join
+            self.observer.join()
         except KeyboardInterrupt:
             self.stop()
 
     async def start_async(self):
         """Start watching (asynchronous)"""
         # Set event loop for async operations
-        self.handler._loop = asyncio.get_running_loop()
+        self._loop = asyncio.get_running_loop()
+        self.handler._loop = self._loop
 
         for path in self.config.watch_paths:
             self.observer.schedule(self.handler, path, recursive=True)
 
         self.observer.start()
         self.is_running = True
+        self._stop_event = asyncio.Event()
+
+        # Route Ctrl-C through the stop event instead of letting
+        # KeyboardInterrupt tear the loop down mid-callback; that way
+        # shutdown always runs the cleanup below. Not every loop
+        # supports signal handlers (Windows, nested loops) - those fall
+        # back to cancellation, which the finally also covers
+        try:
+            self._loop.add_signal_handler(signal.SIGINT, self._stop_event.set)
+            sigint_installed = True
+        except (NotImplementedError, RuntimeError):
+            sigint_installed = False
+
         logger.info(f"🧠 Gitgeist watching: {self.config.watch_paths}")
 
         try:
-            while self.is_running:
-                await asyncio.sleep(1)
+            # Sleep until stop() fires the event instead of polling
+            await self._stop_event.wait()
         except asyncio.CancelledError:
-            self.stop()
+            pass
+        finally:
+            if sigint_installed:
+                self._loop.remove_signal_handler(signal.SIGINT)
+            if self.is_running:
+                self.stop()
+            # Close the keep-alive Ollama session if any commits were
+            # generated; an unclosed session stalls interpreter shutdown
+            if self.handler._commit_generator is not None:
+                await self.handler._commit_generator.llm_client.close()
 
     def stop(self):
         """Stop watching"""
         self.is_running = False
+        if self._stop_event is not None and self._loop is not None:
+            # May be called from the observer or a signal handler
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         self.observer.stop()
         self.observer.join()
         logger.info("👋 Gitgeist stopped watching")
@@ -1,14 +1,34 @@
 # gitgeist/core/workspace.py
-import json
+import asyncio
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import orjson
+
 from gitgeist.core.config import GitgeistConfig
 from gitgeist.utils.exceptions import ConfigurationError
 from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# CommitGenerator pulls in the LLM client and embeddings stack, so it
+# is resolved once on first use rather than at workspace import
+_CommitGenerator = None
+
+
+def _get_commit_generator_cls():
+    """Import CommitGenerator lazily and memoize the class"""
+    global _CommitGenerator
+    if _CommitGenerator is None:
+        from gitgeist.ai.commit_generator import CommitGenerator
+        _CommitGenerator = CommitGenerator
+    return _CommitGenerator
+
 
 class WorkspaceManager:
     """Manages multiple repositories in a workspace"""
@@ -17,6 +37,14 @@ class WorkspaceManager:
         self.workspace_path = workspace_path or Path.home() / ".gitgeist"
         self.workspace_config_path = self.workspace_path / "workspace.json"
         self.workspace_path.mkdir(parents=True, exist_ok=True)
+        # Parsed workspace.json plus the stat signature it was read
+        # under; most CLI commands call several manager methods in a row
+        # and only the first should touch disk
+        self._cache: Optional[Dict] = None
+        self._cache_stat = None
+        # batch_updates() defers flushing to disk until the block exits
+        self._batching = False
+        self._dirty = False
 
     def add_repository(self, repo_path: str, alias: str = None) -> bool:
         """Add repository to workspace"""
@@ -86,7 +114,7 @@ class WorkspaceManager:
         
         # Activate selected
         workspace_config["repositories"][alias]["active"] = True
-        workspace_config["repositories"][alias]["last_used"] = __import__('time').time()
+        workspace_config["repositories"][alias]["last_used"] = time.time()
         
         self._save_workspace_config(workspace_config)
         logger.info(f"Set active repository: {alias}")
@@ -104,29 +132,86 @@ class WorkspaceManager:
 
     def _load_workspace_config(self) -> Dict:
         """Load workspace configuration"""
-        if not self.workspace_config_path.exists():
+        # Inside batch_updates() the cache holds unflushed changes and
+        # is the source of truth
+        if self._dirty:
+            return self._cache
+
+        try:
+            stat = os.stat(self.workspace_config_path)
+        except OSError:
             return {
                 "version": "1.0",
                 "repositories": {},
                 "global_settings": {}
             }
-        
+
+        # Serve the cached parse while the file on disk is unchanged;
+        # another process editing workspace.json bumps mtime/size and
+        # invalidates it
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache_stat == stat_key:
+            return self._cache
+
         try:
-            with open(self.workspace_config_path, 'r') as f:
-                return json.load(f)
+            config = orjson.loads(self.workspace_config_path.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load workspace config: {e}")
             return {"version": "1.0", "repositories": {}, "global_settings": {}}
 
+        self._cache = config
+        self._cache_stat = stat_key
+        return config
+
     def _save_workspace_config(self, config: Dict) -> None:
         """Save workspace configuration"""
+        if self._batching:
+            self._cache = config
+            self._dirty = True
+            return
+
+        self._write_workspace_config(config)
+
+    def _write_workspace_config(self, config: Dict) -> None:
+        """Flush workspace configuration to disk atomically"""
         try:
-            with open(self.workspace_config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write-then-rename so a crash mid-write can't leave a torn
+            # workspace.json behind
+            tmp_path = self.workspace_config_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(
+                orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            )
+            os.replace(tmp_path, self.workspace_config_path)
+
+            self._cache = config
+            self._cache_stat = None
+            try:
+                stat = os.stat(self.workspace_config_path)
+                self._cache_stat = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                self._cache = None
         except Exception as e:
             logger.error(f"Failed to save workspace config: {e}")
             raise ConfigurationError(f"Cannot save workspace config: {e}")
 
+    @contextmanager
+    def batch_updates(self):
+        """Defer config writes so a run of updates hits disk once"""
+        if self._batching:
+            # Nested batches flush when the outermost block exits
+            yield self
+            return
+
+        self._batching = True
+        try:
+            yield self
+            if self._dirty:
+                self._dirty = False
+                self._write_workspace_config(self._cache)
+        finally:
+            self._batching = False
+            self._dirty = False
+
 
 class MultiRepoCommitGenerator:
     """Commit generator that works across multiple repositories"""
@@ -136,71 +221,118 @@ class MultiRepoCommitGenerator:
 
     def commit_all_repositories(self, message: str = None) -> Dict[str, bool]:
         """Commit changes in all active repositories"""
-        results = {}
+        return dict(self.iter_commit_all_repositories(message))
+
+    def _commit_one(self, alias: str, repo_info: Dict, message) -> tuple:
+        """Generate and create a commit in one repository (worker thread)"""
+        repo_path = Path(repo_info["path"])
+
+        try:
+            # Repo-specific config and an explicit cwd instead of a
+            # process-wide os.chdir, which is unsafe once repos run
+            # concurrently
+            config = GitgeistConfig.load(repo_path / ".gitgeist.json")
+            generator = _get_commit_generator_cls()(config, cwd=repo_path)
+
+            # Each worker thread drives its own event loop for the
+            # async generation pipeline; the keep-alive LLM session has
+            # to close inside that loop, like every other call site
+            async def generate_and_close():
+                try:
+                    return await generator.generate_and_commit(
+                        message, auto_commit=True
+                    )
+                finally:
+                    await generator.llm_client.close()
+
+            result = asyncio.run(generate_and_close())
+            return alias, result.get("committed", False)
+
+        except Exception as e:
+            logger.error(f"Failed to commit in {alias}: {e}")
+            return alias, False
+
+    def iter_commit_all_repositories(self, message: str = None):
+        """Commit active repositories concurrently, yielding (alias, success)
+
+        Results arrive in completion order, so a live display fills in
+        as each repository finishes instead of waiting on the slowest.
+        """
         repositories = self.workspace.list_repositories()
-        
-        for alias, repo_info in repositories.items():
-            if not repo_info.get("active", True):
-                continue
-            
-            repo_path = Path(repo_info["path"])
-            
-            try:
-                # Change to repository directory
-                import os
-                original_cwd = os.getcwd()
-                os.chdir(repo_path)
-                
-                # Load repository-specific config
-                config = GitgeistConfig.load()
-                
-                # Generate commit
-                from gitgeist.ai.commit_generator import CommitGenerator
-                generator = CommitGenerator(config)
-                
-                import asyncio
-                result = asyncio.run(generator.generate_and_commit(message, auto_commit=True))
-                results[alias] = result.get("committed", False)
-                
-            except Exception as e:
-                logger.error(f"Failed to commit in {alias}: {e}")
-                results[alias] = False
-            finally:
-                os.chdir(original_cwd)
-        
-        return results
+        active = [
+            (alias, repo_info)
+            for alias, repo_info in repositories.items()
+            if repo_info.get("active", True)
+        ]
+        if not active:
+            return
+
+        # Commits are dominated by git subprocesses and LLM round
+        # trips, so repos overlap well; the pool bound keeps git/LLM
+        # pressure in check
+        with ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 4)
+        ) as pool:
+            futures = [
+                pool.submit(self._commit_one, alias, repo_info, message)
+                for alias, repo_info in active
+            ]
+            for future in as_completed(futures):
+                yield future.result()
 
     def get_status_all_repositories(self) -> Dict[str, Dict]:
         """Get status for all repositories"""
-        status = {}
+        return dict(self.iter_status_all_repositories())
+
+    def _status_one(self, alias: str, repo_info: Dict) -> tuple:
+        """Run git status for one repository (worker thread)"""
+        repo_path = Path(repo_info["path"])
+
+        try:
+            result = subprocess.run(
+                ["git", "status", "--porcelain"],
+                cwd=repo_path,
+                capture_output=True,
+                check=True
+            )
+
+            # Porcelain emits one newline-terminated record per file;
+            # count bytes instead of decoding and splitting
+            changes = result.stdout.count(b"\n")
+            if result.stdout and not result.stdout.endswith(b"\n"):
+                changes += 1
+
+            return alias, {
+                "path": str(repo_path),
+                "changes": changes,
+                "clean": changes == 0,
+                "active": repo_info.get("active", True)
+            }
+
+        except Exception as e:
+            return alias, {
+                "path": str(repo_path),
+                "error": str(e),
+                "active": repo_info.get("active", True)
+            }
+
+    def iter_status_all_repositories(self):
+        """Get per-repository status, yielding (alias, info) as each completes
+
+        Status is subprocess-bound, so one thread per repo overlaps the
+        git children and overall latency tracks the slowest repo rather
+        than the sum of them.
+        """
         repositories = self.workspace.list_repositories()
-        
-        for alias, repo_info in repositories.items():
-            repo_path = Path(repo_info["path"])
-            
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                
-                changes = len([line for line in result.stdout.strip().split('\n') if line])
-                status[alias] = {
-                    "path": str(repo_path),
-                    "changes": changes,
-                    "clean": changes == 0,
-                    "active": repo_info.get("active", True)
-                }
-                
-            except Exception as e:
-                status[alias] = {
-                    "path": str(repo_path),
-                    "error": str(e),
-                    "active": repo_info.get("active", True)
-                }
-        
-        return status
\ No newline at end of file
+        if not repositories:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 2)
+        ) as pool:
+            futures = [
+                pool.submit(self._status_one, alias, repo_info)
+                for alias, repo_info in repositories.items()
+            ]
+            for future in as_completed(futures):
+                yield future.result()
\ No newline at end of file
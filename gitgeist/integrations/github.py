@@ -1,15 +1,70 @@
 # gitgeist/integrations/github.py
+import asyncio
+import functools
 import json
+import os
+import re
 import subprocess
 from typing import Dict, List, Optional
 
 import aiohttp
 
+from gitgeist.core.caching import CacheManager
 from gitgeist.utils.exceptions import GitgeistError
 from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pulls the last page number out of GitHub's Link pagination header
+_LINK_LAST_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _project_issue(item: Dict) -> Dict:
+    """Keep only the issue fields callers read; bodies dominate payload
+    size and nothing downstream touches them"""
+    return {
+        "number": item["number"],
+        "title": item["title"],
+        "state": item.get("state"),
+        "labels": [label["name"] for label in item.get("labels", ())],
+    }
+
+# Both SSH and HTTPS GitHub remotes in one match; the optional .git is
+# anchored to the end so dotted repo names survive
+_GITHUB_REMOTE_RE = re.compile(
+    r"(?:git@github\.com:|https://github\.com/)([^/]+)/(.+?)(?:\.git)?/?$"
+)
+
+
+async def _run_git(*args: str) -> Optional[str]:
+    """Run one git command without blocking the loop; None on failure"""
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await proc.communicate()
+    if proc.returncode != 0:
+        return None
+    return stdout.decode().strip()
+
+
+@functools.lru_cache(maxsize=32)
+def _remote_url(cwd: str) -> Optional[str]:
+    """Fetch the origin remote URL, once per working directory"""
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+        return result.stdout.strip()
+    except subprocess.CalledProcessError:
+        return None
+
 
 class GitHubIntegration:
     """GitHub API integration for PR and issue management"""
@@ -25,12 +80,40 @@ class GitHubIntegration:
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
 
-    async def create_pull_request(self, owner: str, repo: str, 
+        self._session: Optional[aiohttp.ClientSession] = None
+        # ETag-validated response cache; survives across CLI invocations
+        self._cache = CacheManager()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get (or open) the shared HTTP session"""
+        # One session per integration keeps TCP+TLS connections alive
+        # across calls instead of a fresh handshake per request
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "GitHubIntegration":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def create_pull_request(self, owner: str, repo: str,
                                 title: str, body: str, head: str, base: str = "main") -> Dict:
         """Create a pull request"""
         if not self.token:
             raise GitgeistError("GitHub token required for PR creation")
-        
+
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls"
         data = {
             "title": title,
@@ -38,58 +121,78 @@ class GitHubIntegration:
             "head": head,
             "base": base
         }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self.headers, json=data) as response:
-                if response.status == 201:
-                    return await response.json()
-                else:
-                    error_data = await response.json()
-                    raise GitgeistError(f"Failed to create PR: {error_data.get('message', 'Unknown error')}")
+
+        async with self._get_session().post(url, json=data) as response:
+            if response.status == 201:
+                return await response.json()
+            else:
+                error_data = await response.json()
+                raise GitgeistError(f"Failed to create PR: {error_data.get('message', 'Unknown error')}")
 
     async def get_issues(self, owner: str, repo: str, state: str = "open") -> List[Dict]:
-        """Get repository issues"""
+        """Get all repository issues, paginated and ETag-cached"""
         url = f"{self.base_url}/repos/{owner}/{repo}/issues"
-        params = {"state": state}
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise GitgeistError(f"Failed to get issues: {response.status}")
+        params = {"state": state, "per_page": 100}
+        session = self._get_session()
+
+        # Revalidate against the cached ETag; a 304 costs one round trip
+        # with no body and no JSON parse
+        cache_key = f"github_issues:{owner}/{repo}:{state}"
+        cached = self._cache.get(cache_key)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status == 304 and cached:
+                logger.debug(f"Issue list unchanged for {owner}/{repo} (304)")
+                return cached["issues"]
+            if response.status != 200:
+                raise GitgeistError(f"Failed to get issues: {response.status}")
+
+            etag = response.headers.get("ETag")
+            issues = [_project_issue(item) for item in await response.json()]
+            last_page = self._last_page(response.headers.get("Link", ""))
+
+        if last_page > 1:
+            # Remaining pages are independent GETs, so fetch them in
+            # parallel over the pooled connections
+            async def fetch_page(page: int) -> List[Dict]:
+                page_params = dict(params, page=page)
+                async with session.get(url, params=page_params) as resp:
+                    if resp.status != 200:
+                        raise GitgeistError(f"Failed to get issues: {resp.status}")
+                    return [_project_issue(item) for item in await resp.json()]
+
+            pages = await asyncio.gather(
+                *(fetch_page(page) for page in range(2, last_page + 1))
+            )
+            for page_issues in pages:
+                issues.extend(page_issues)
+
+        if etag:
+            self._cache.set(cache_key, {"etag": etag, "issues": issues})
+
+        return issues
+
+    @staticmethod
+    def _last_page(link_header: str) -> int:
+        """Parse the last page number from a Link header"""
+        match = _LINK_LAST_RE.search(link_header)
+        return int(match.group(1)) if match else 1
 
     def get_repo_from_remote(self) -> Optional[tuple]:
         """Extract owner/repo from git remote"""
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            remote_url = result.stdout.strip()
-            
-            # Parse GitHub URL
-            if "github.com" in remote_url:
-                if remote_url.startswith("git@"):
-                    # SSH format: git@github.com:owner/repo.git
-                    parts = remote_url.split(":")[-1].replace(".git", "").split("/")
-                elif remote_url.startswith("https://"):
-                    # HTTPS format: https://github.com/owner/repo.git
-                    parts = remote_url.replace("https://github.com/", "").replace(".git", "").split("/")
-                else:
-                    return None
-                
-                if len(parts) >= 2:
-                    return parts[0], parts[1]
-            
-            return None
-            
-        except subprocess.CalledProcessError:
+        # The remote rarely changes within a process, so the subprocess
+        # runs once per cwd and this is pure parsing afterwards
+        remote_url = _remote_url(os.getcwd())
+        if not remote_url:
             return None
 
+        match = _GITHUB_REMOTE_RE.match(remote_url)
+        if match:
+            return match.group(1), match.group(2)
+
+        return None
+
     async def auto_create_pr_from_branch(self, title: str = None, body: str = None) -> Optional[Dict]:
         """Automatically create PR from current branch"""
         repo_info = self.get_repo_from_remote()
@@ -97,38 +200,37 @@ class GitHubIntegration:
             raise GitgeistError("Could not determine GitHub repository from remote")
         
         owner, repo = repo_info
-        
-        # Get current branch
-        try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True
+
+        # Branch and commit log are independent reads, so launch both
+        # children at once; symbolic-ref skips the ref enumeration that
+        # `branch --show-current` does
+        if body:
+            current_branch = await _run_git("symbolic-ref", "--short", "HEAD")
+            log_output = None
+        else:
+            # git renders the markdown bullets itself, so the output is
+            # used as-is instead of being split and rejoined in Python
+            current_branch, log_output = await asyncio.gather(
+                _run_git("symbolic-ref", "--short", "HEAD"),
+                _run_git(
+                    "log", "--max-count=100", "--pretty=format:- %h %s", "main..HEAD"
+                ),
             )
-            current_branch = result.stdout.strip()
-        except subprocess.CalledProcessError:
+
+        if not current_branch:
             raise GitgeistError("Could not determine current branch")
-        
+
         if current_branch in ["main", "master"]:
             raise GitgeistError("Cannot create PR from main branch")
-        
+
         # Generate title and body if not provided
         if not title:
             title = f"feat: {current_branch.replace('/', ' - ')}"
-        
+
         if not body:
-            # Get recent commits for body
-            try:
-                result = subprocess.run(
-                    ["git", "log", "--oneline", "main..HEAD"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                commits = result.stdout.strip().split('\n')
-                body = f"## Changes\n\n" + "\n".join(f"- {commit}" for commit in commits if commit)
-            except subprocess.CalledProcessError:
+            if log_output:
+                body = f"## Changes\n\n{log_output}"
+            else:
                 body = f"Pull request from branch: {current_branch}"
-        
+
         return await self.create_pull_request(owner, repo, title, body, current_branch)
\ No newline at end of file
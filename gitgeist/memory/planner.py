@@ -1,17 +1,59 @@
 # gitgeist/memory/planner.py
-from typing import Dict, List, Optional
+import hashlib
+import os
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
+from gitgeist.core.caching import CacheManager
 from gitgeist.memory.vector_store import GitgeistMemory
 from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fix-like symbol names mark a change set as a bug fix
+_FIX_RE = re.compile(r"fix", re.IGNORECASE)
+
+# Extension -> file type, resolved with one hash lookup instead of
+# chained endswith scans over suffix tuples
+_EXT_TO_TYPE = {
+    ".py": "code",
+    ".js": "code",
+    ".ts": "code",
+    ".md": "docs",
+    ".txt": "docs",
+    ".rst": "docs",
+    ".json": "config",
+    ".yml": "config",
+    ".yaml": "config",
+    ".toml": "config",
+}
+
 
 class GitgeistPlanner:
     """AI planner for intelligent commit grouping and suggestions"""
 
     def __init__(self, memory: GitgeistMemory):
         self.memory = memory
+        # Similarity searches repeat for previews/dry runs of the same
+        # change set; cache them on disk across invocations
+        self._cache = CacheManager()
+
+    def _find_similar_cached(self, query: str, limit: int = 3) -> List[Dict]:
+        """find_similar_commits memoized on a digest of the query"""
+        digest = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+        # v2: entries hold CommitHit tuples, not dicts
+        cache_key = f"similar_commits:v2:{digest}:{limit}"
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        similar = self.memory.find_similar_commits(query, limit=limit)
+        # Short TTL so freshly stored commits surface without an
+        # explicit eviction hook on the vector store
+        self._cache.set(cache_key, similar, ttl=300)
+        return similar
 
     def analyze_changes_with_context(self, current_changes: List[Dict]) -> Dict:
         """Analyze current changes with historical context"""
@@ -32,7 +74,7 @@ class GitgeistPlanner:
             query = f"Files: {', '.join(files_changed[:3])} | {' | '.join(query_parts)}"
             
             # Find similar historical commits
-            similar_commits = self.memory.find_similar_commits(query, limit=3)
+            similar_commits = self._find_similar_cached(query, limit=3)
             
             # Analyze patterns
             patterns = self._analyze_patterns(current_changes, similar_commits)
@@ -77,7 +119,7 @@ class GitgeistPlanner:
                 patterns['change_type'] = 'architecture_change'
             elif any('test' in change['filepath'].lower() for change in current_changes):
                 patterns['change_type'] = 'testing'
-            elif any('fix' in str(change.get('semantic_changes', {})) for change in current_changes):
+            elif any(self._mentions_fix(change) for change in current_changes):
                 patterns['change_type'] = 'bug_fix'
             
             # Determine complexity
@@ -89,12 +131,14 @@ class GitgeistPlanner:
             
             # Find common patterns with historical commits
             if similar_commits:
-                historical_files = []
+                # Accumulate straight into sets; no intermediate lists
+                # to extend and re-hash
+                historical_files = set()
                 for commit in similar_commits:
-                    historical_files.extend(commit.get('files_changed', []))
-                
-                current_files = [c['filepath'] for c in current_changes]
-                patterns['common_files'] = list(set(current_files) & set(historical_files))
+                    historical_files.update(commit.files_changed)
+
+                current_files = {c['filepath'] for c in current_changes}
+                patterns['common_files'] = list(historical_files & current_files)
             
             return patterns
             
@@ -102,6 +146,22 @@ class GitgeistPlanner:
             logger.error(f"Failed to analyze patterns: {e}")
             return patterns
 
+    @staticmethod
+    def _mentions_fix(change: Dict) -> bool:
+        """True when any changed symbol name looks fix-related"""
+        # The old check stringified the whole semantic_changes dict and
+        # substring-scanned it; match the symbol names directly instead
+        sc = change.get('semantic_changes')
+        if not sc:
+            return False
+
+        search = _FIX_RE.search
+        for key in ('functions_added', 'functions_modified', 'functions_removed',
+                    'classes_added', 'classes_removed'):
+            if any(search(name) for name in sc.get(key, ())):
+                return True
+        return False
+
     def _generate_suggestions(self, patterns: Dict) -> List[str]:
         """Generate intelligent suggestions based on patterns"""
         suggestions = []
@@ -138,26 +198,37 @@ class GitgeistPlanner:
             logger.error(f"Failed to generate suggestions: {e}")
             return ["Review changes carefully before committing"]
 
+    @staticmethod
+    def _classify_file(filepath: str) -> Optional[str]:
+        """Categorize a file path as test, code, docs or config"""
+        # One lower() and one splitext, then a table lookup
+        lowered = filepath.lower()
+        if 'test' in lowered:
+            return 'test'
+        return _EXT_TO_TYPE.get(os.path.splitext(lowered)[1])
+
+    @staticmethod
+    def _classify_many(paths: List[str]) -> List[Optional[str]]:
+        """Classify paths in one pass"""
+        # Per-path cost is a lower(), a splitext and a dict probe -
+        # far below what any worker pool costs to spin up
+        classify = GitgeistPlanner._classify_file
+        return [classify(path) for path in paths]
+
     def should_split_commit(self, changes: List[Dict]) -> Optional[Dict]:
         """Determine if changes should be split into multiple commits"""
         try:
-            # Analyze change types
+            # Classify each change once; the grouping step below reuses
+            # the labels instead of re-running the same cascade
+            labels = self._classify_many([c['filepath'] for c in changes])
+            classified: List[Tuple[Dict, Optional[str]]] = list(zip(changes, labels))
             change_types = set()
             file_types = set()
-            
-            for change in changes:
-                filepath = change['filepath']
-                
-                # Categorize by file type
-                if 'test' in filepath.lower():
-                    file_types.add('test')
-                elif filepath.endswith(('.py', '.js', '.ts')):
-                    file_types.add('code')
-                elif filepath.endswith(('.md', '.txt', '.rst')):
-                    file_types.add('docs')
-                elif filepath.endswith(('.json', '.yml', '.yaml', '.toml')):
-                    file_types.add('config')
-                
+
+            for change, file_type in classified:
+                if file_type:
+                    file_types.add(file_type)
+
                 # Categorize by semantic changes
                 if change.get('semantic_changes'):
                     sc = change['semantic_changes']
@@ -167,52 +238,46 @@ class GitgeistPlanner:
                         change_types.add('removal')
                     elif sc.get('functions_modified'):
                         change_types.add('modification')
-            
+
             # Suggest split if mixing different types
             if len(file_types) > 2 or len(change_types) > 1:
                 return {
                     'should_split': True,
                     'reason': f"Mixed change types: {', '.join(change_types)} across {', '.join(file_types)}",
-                    'suggested_groups': self._suggest_commit_groups(changes, file_types, change_types)
+                    'suggested_groups': self._suggest_commit_groups(classified)
                 }
-            
+
             return {'should_split': False}
-            
+
         except Exception as e:
             logger.error(f"Failed to analyze commit split: {e}")
             return {'should_split': False, 'error': str(e)}
 
-    def _suggest_commit_groups(self, changes: List[Dict], file_types: set, 
-                              change_types: set) -> List[Dict]:
+    def _suggest_commit_groups(
+        self, classified: List[Tuple[Dict, Optional[str]]]
+    ) -> List[Dict]:
         """Suggest how to group changes into commits"""
         groups = []
-        
+
         try:
-            # Group by file type first
-            type_groups = {'test': [], 'code': [], 'docs': [], 'config': []}
-            
-            for change in changes:
-                filepath = change['filepath']
-                if 'test' in filepath.lower():
-                    type_groups['test'].append(change)
-                elif filepath.endswith(('.py', '.js', '.ts')):
-                    type_groups['code'].append(change)
-                elif filepath.endswith(('.md', '.txt', '.rst')):
-                    type_groups['docs'].append(change)
-                elif filepath.endswith(('.json', '.yml', '.yaml', '.toml')):
-                    type_groups['config'].append(change)
-            
+            # Group by the file types computed in should_split_commit
+            type_groups = defaultdict(list)
+            for change, file_type in classified:
+                if file_type:
+                    type_groups[file_type].append(change)
+
             # Create commit groups
-            for group_type, group_changes in type_groups.items():
+            for group_type in ('test', 'code', 'docs', 'config'):
+                group_changes = type_groups[group_type]
                 if group_changes:
                     groups.append({
                         'type': group_type,
                         'files': [c['filepath'] for c in group_changes],
                         'suggested_message': self._suggest_group_message(group_type, group_changes)
                     })
-            
+
             return groups
-            
+
         except Exception as e:
             logger.error(f"Failed to suggest commit groups: {e}")
             return []
@@ -227,12 +292,16 @@ class GitgeistPlanner:
             elif group_type == 'config':
                 return f"chore: update configuration files"
             else:
-                # Analyze semantic changes for code
-                functions_added = sum(len(c.get('semantic_changes', {}).get('functions_added', [])) 
-                                    for c in changes)
-                classes_added = sum(len(c.get('semantic_changes', {}).get('classes_added', [])) 
-                                  for c in changes)
-                
+                # Analyze semantic changes for code; both statistics
+                # come out of one pass over the changes
+                functions_added = 0
+                classes_added = 0
+                for change in changes:
+                    sc = change.get('semantic_changes') or {}
+                    functions_added += len(sc.get('functions_added', ()))
+                    classes_added += len(sc.get('classes_added', ()))
+
+
                 if functions_added > 0:
                     return f"feat: add {functions_added} new functions"
                 elif classes_added > 0:
@@ -1,11 +1,18 @@
 # gitgeist/memory/vector_store.py
-import json
+import atexit
+import functools
+import hashlib
 import os
+import re
 import sqlite3
+import time
+from collections import namedtuple
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+import orjson
 from sentence_transformers import SentenceTransformer
 
 from gitgeist.utils.logger import get_logger
@@ -15,6 +22,75 @@ os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
 
 logger = get_logger(__name__)
 
+# Buffered commits are encoded together once this many pile up
+_FLUSH_THRESHOLD = 32
+
+# Symmetric int8 scale for stored embeddings; unit-norm MiniLM vectors
+# quantize to a quarter of the float32 blob size with negligible effect
+# on cosine ranking
+_QUANT_SCALE = 127
+
+
+def _quantize(embedding: np.ndarray) -> bytes:
+    """Quantize a normalized embedding to an int8 blob"""
+    return (embedding * _QUANT_SCALE).round().astype(np.int8).tobytes()
+
+
+# Cap on FTS-matched rows fed into the cosine step
+_FTS_CANDIDATES = 200
+
+# Queries are arbitrary text (colons, pipes, quotes), so only word
+# characters make it into the FTS MATCH expression
+_FTS_TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+# Search results as a C-allocated struct with slot access instead of a
+# five-key dict per row
+CommitHit = namedtuple(
+    "CommitHit", "hash message files_changed semantic_changes similarity"
+)
+
+
+def _json_default(o):
+    """Lets orjson serialize the sets that semantic_changes carries"""
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
+
+
+def _pick_device() -> Optional[str]:
+    """Pick the fastest device torch reports; None keeps the default"""
+    try:
+        import torch
+    except ImportError:
+        return None
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if getattr(torch.backends, "mps", None) and torch.backends.mps.is_available():
+        return "mps"
+
+    # On the CPU path torch defaults to one thread in some builds;
+    # a few threads speed encode up considerably
+    torch.set_num_threads(min(8, os.cpu_count() or 4))
+    return "cpu"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model(name: str) -> SentenceTransformer:
+    """Load the embedding model once per process; the weights are ~90MB
+    and every GitgeistMemory construction was paying that again"""
+    device = _pick_device()
+    if device == "cpu":
+        # Without a GPU, encode dominates commit latency; the ONNX
+        # backend reaches onnxruntime's fused int8 GEMMs when optimum
+        # is installed and falls back to torch when it isn't
+        try:
+            return SentenceTransformer(name, device="cpu", backend="onnx")
+        except Exception as e:
+            logger.debug("ONNX backend unavailable, using torch: %s", e)
+    return SentenceTransformer(name, device=device)
+
 
 class GitgeistMemory:
     """Simple vector store for commit history and code context"""
@@ -22,140 +98,343 @@ class GitgeistMemory:
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.db_path = data_dir / "memory.db"
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
-        self._init_db()
+        self.model = _get_model("all-MiniLM-L6-v2")
+        # Commits waiting to be encoded; single-string encode() wastes
+        # most of the transformer batch, so writes buffer here and are
+        # embedded together
+        self._pending_commits: List[Tuple[str, Tuple]] = []
+        self._conn = self._init_db()
+        atexit.register(self.close)
 
-    def _init_db(self):
+    def _init_db(self) -> sqlite3.Connection:
         """Initialize SQLite database for memory storage"""
         self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        # One long-lived autocommit connection instead of an open per
+        # call; WAL drops the rollback-journal fsyncs and lets readers
+        # overlap flush writes
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        # 1GB mmap keeps the whole database served from page-cache
+        # mappings, so blob reads skip the read() copy into SQLite's
+        # own page cache
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=1073741824;
+        """)
+        # REPLACE only fires the FTS delete trigger when recursive
+        # triggers are on; without it re-stored commits would leave
+        # stale index entries behind
+        conn.execute("PRAGMA recursive_triggers = ON")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS commits (
+                id INTEGER PRIMARY KEY,
+                hash TEXT UNIQUE,
+                message TEXT,
+                files_changed TEXT,
+                semantic_changes TEXT,
+                embedding BLOB,
+                timestamp REAL
+            )
+        """)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS commits (
-                    id INTEGER PRIMARY KEY,
-                    hash TEXT UNIQUE,
-                    message TEXT,
-                    files_changed TEXT,
-                    semantic_changes TEXT,
-                    embedding BLOB,
-                    timestamp REAL
-                )
-            """)
-            
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS file_context (
-                    id INTEGER PRIMARY KEY,
-                    filepath TEXT,
-                    content_hash TEXT,
-                    functions TEXT,
-                    classes TEXT,
-                    embedding BLOB,
-                    last_updated REAL
-                )
-            """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_context (
+                id INTEGER PRIMARY KEY,
+                filepath TEXT,
+                content_hash TEXT,
+                functions TEXT,
+                classes TEXT,
+                embedding BLOB,
+                last_updated REAL
+            )
+        """)
+
+        # Encode results keyed by text hash; watcher churn re-stores
+        # the same file structure text over and over and each encode
+        # costs tens of milliseconds on CPU
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS emb_cache (
+                text_hash TEXT PRIMARY KEY,
+                embedding BLOB
+            )
+        """)
+
+        # Keyword index over commits so searches with literal terms
+        # (file names, function names) can prune candidates before
+        # the embedding scan
+        fts_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'commits_fts'"
+        ).fetchone()
+
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS commits_fts USING fts5(
+                message, files_changed, semantic_changes,
+                content='commits', content_rowid='id'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS commits_fts_insert
+            AFTER INSERT ON commits BEGIN
+                INSERT INTO commits_fts(rowid, message, files_changed, semantic_changes)
+                VALUES (new.id, new.message, new.files_changed, new.semantic_changes);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS commits_fts_delete
+            AFTER DELETE ON commits BEGIN
+                INSERT INTO commits_fts(commits_fts, rowid, message, files_changed, semantic_changes)
+                VALUES ('delete', old.id, old.message, old.files_changed, old.semantic_changes);
+            END
+        """)
+
+        if not fts_exists:
+            # Backfill rows written before the index existed
+            conn.execute("INSERT INTO commits_fts(commits_fts) VALUES ('rebuild')")
+
+        return conn
 
     def store_commit(self, commit_hash: str, message: str, files_changed: List[str], 
                     semantic_changes: Dict) -> None:
         """Store commit information with vector embedding"""
         try:
-            # Convert sets to lists for JSON serialization
-            def convert_sets_to_lists(obj):
-                if isinstance(obj, dict):
-                    return {k: convert_sets_to_lists(v) for k, v in obj.items()}
-                elif isinstance(obj, set):
-                    return list(obj)
-                elif isinstance(obj, list):
-                    return [convert_sets_to_lists(item) for item in obj]
-                else:
-                    return obj
-            
-            serializable_changes = convert_sets_to_lists(semantic_changes)
-            
-            # Create text for embedding
-            text = f"{message} | Files: {', '.join(files_changed[:5])}"
-            if serializable_changes:
-                funcs = serializable_changes.get('functions_added', [])
-                classes = serializable_changes.get('classes_added', [])
+            # Create text for embedding; islice works on the sets or
+            # lists these arrive as without a slicing copy
+            text = f"{message} | Files: {', '.join(islice(files_changed, 5))}"
+            if semantic_changes:
+                funcs = semantic_changes.get('functions_added') or ()
+                classes = semantic_changes.get('classes_added') or ()
                 if funcs:
-                    text += f" | Functions: {', '.join(funcs[:3])}"
+                    text += f" | Functions: {', '.join(islice(funcs, 3))}"
                 if classes:
-                    text += f" | Classes: {', '.join(classes[:3])}"
+                    text += f" | Classes: {', '.join(islice(classes, 3))}"
 
-            # Generate embedding
-            embedding = self.model.encode(text)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO commits 
-                    (hash, message, files_changed, semantic_changes, embedding, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+            # Buffer instead of encoding immediately; bulk imports like
+            # populate_memory_from_history then embed in whole batches
+            self._pending_commits.append((
+                text,
+                (
                     commit_hash,
                     message,
-                    json.dumps(files_changed),
-                    json.dumps(serializable_changes),
-                    embedding.tobytes(),
-                    __import__('time').time()
-                ))
-                
-            logger.debug(f"Stored commit {commit_hash[:8]} in memory")
-            
+                    orjson.dumps(files_changed).decode(),
+                    # Sets convert inside the C serializer instead of a
+                    # recursive Python pre-walk over the whole dict
+                    orjson.dumps(
+                        semantic_changes, default=_json_default
+                    ).decode(),
+                    time.time(),
+                ),
+            ))
+            if len(self._pending_commits) >= _FLUSH_THRESHOLD:
+                self.flush()
+
+            logger.debug("Buffered commit %s for memory", commit_hash[:8])
+
+        except Exception as e:
+            logger.error("Failed to store commit %s: %s", commit_hash, e)
+
+    def flush(self) -> None:
+        """Encode and persist any buffered commits in one batch"""
+        if not self._pending_commits:
+            return
+
+        pending, self._pending_commits = self._pending_commits, []
+
+        try:
+            embeddings = self.model.encode(
+                [text for text, _ in pending],
+                batch_size=_FLUSH_THRESHOLD,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+
+            # Explicit transaction: one commit for the whole batch
+            # instead of an autocommit per row
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("""
+                    INSERT OR REPLACE INTO commits
+                    (hash, message, files_changed, semantic_changes, embedding, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [
+                    params[:4] + (_quantize(embedding), params[4])
+                    for (_, params), embedding in zip(pending, embeddings)
+                ])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            logger.debug("Flushed %d commits to memory", len(pending))
+
         except Exception as e:
-            logger.error(f"Failed to store commit {commit_hash}: {e}")
+            logger.error("Failed to flush commit buffer: %s", e)
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Encode text, reusing the cached embedding for repeated content"""
+        # blake2b is the fastest stdlib hash and 16 bytes is plenty of
+        # key space for a per-repo cache
+        key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        row = self._conn.execute(
+            "SELECT embedding FROM emb_cache WHERE text_hash = ?", (key,)
+        ).fetchone()
+        if row:
+            return np.frombuffer(row[0], dtype=np.float32)
+
+        embedding = np.asarray(
+            self.model.encode(text, normalize_embeddings=True), dtype=np.float32
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO emb_cache VALUES (?, ?)",
+            (key, embedding.tobytes()),
+        )
+        return embedding
+
+    def close(self) -> None:
+        """Flush pending writes and close the database connection"""
+        self.flush()
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
 
-    def find_similar_commits(self, query: str, limit: int = 5) -> List[Dict]:
+    def find_similar_commits(self, query: str, limit: int = 5) -> List[CommitHit]:
         """Find similar commits based on semantic similarity"""
         try:
-            query_embedding = self.model.encode(query)
+            # Buffered writes must land before they can be searched
+            self.flush()
+            query_embedding = self._embed(query)
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT hash, message, files_changed, semantic_changes, embedding
-                    FROM commits ORDER BY timestamp DESC LIMIT 50
-                """)
-                
-                results = []
-                for row in cursor.fetchall():
-                    stored_embedding = np.frombuffer(row[4], dtype=np.float32)
-                    similarity = np.dot(query_embedding, stored_embedding) / (
-                        np.linalg.norm(query_embedding) * np.linalg.norm(stored_embedding)
-                    )
-                    
-                    results.append({
-                        'hash': row[0],
-                        'message': row[1],
-                        'files_changed': json.loads(row[2]),
-                        'semantic_changes': json.loads(row[3]),
-                        'similarity': float(similarity)
-                    })
-                
-                # Sort by similarity and return top results
-                results.sort(key=lambda x: x['similarity'], reverse=True)
-                return results[:limit]
-                
+            # Keyword hits narrow the cosine step to O(matches); when
+            # nothing matches, fall back to the full scan. With int8
+            # blobs and one matvec the full scan is still cheaper than
+            # the old 50-row Python loop was
+            candidate_ids = self._fts_candidates(self._conn, query)
+            if candidate_ids:
+                placeholders = ",".join("?" * len(candidate_ids))
+                cursor = self._conn.execute(
+                    f"SELECT id, embedding FROM commits WHERE id IN ({placeholders})",
+                    candidate_ids,
+                )
+            else:
+                cursor = self._conn.execute("SELECT id, embedding FROM commits")
+
+            # Stream only (id, blob) pairs; message and JSON columns
+            # stay on disk until the winners are known
+            row_ids = []
+            blobs = []
+            for row_id, blob in cursor:
+                row_ids.append(row_id)
+                blobs.append(blob)
+            if not blobs:
+                return []
+
+            query_norm = float(np.vdot(query_embedding, query_embedding)) ** 0.5
+            q = np.asarray(query_embedding, dtype=np.float32) / (query_norm or 1.0)
+
+            # Stack every stored vector into one (N, 384) matrix so
+            # all similarities come out of a single BLAS matvec.
+            # int8 blobs are one byte per dimension; float32 rows
+            # written before quantization decode individually
+            dim = q.size
+            if all(len(blob) == dim for blob in blobs):
+                mat = np.frombuffer(
+                    b"".join(blobs), dtype=np.int8
+                ).astype(np.float32).reshape(len(blobs), -1)
+                mat *= 1.0 / _QUANT_SCALE
+            else:
+                mat = np.stack([
+                    np.frombuffer(blob, dtype=np.int8).astype(np.float32)
+                    * (1.0 / _QUANT_SCALE)
+                    if len(blob) == dim
+                    else np.frombuffer(blob, dtype=np.float32)
+                    for blob in blobs
+                ])
+            sims = mat @ q
+
+            # Rows written before embeddings were stored normalized
+            # may carry arbitrary norms; one vectorized pass keeps
+            # their scores exact
+            norms = np.sqrt(np.einsum("ij,ij->i", mat, mat))
+            np.divide(sims, norms, out=sims, where=norms > 0)
+
+            # Partial top-k selection
+            if limit < len(blobs):
+                top = np.argpartition(sims, -limit)[-limit:]
+            else:
+                top = np.arange(len(blobs))
+            top = top[np.argsort(sims[top])[::-1]]
+
+            # Fetch and JSON-decode full rows only for the winners
+            winner_ids = [row_ids[idx] for idx in top]
+            placeholders = ",".join("?" * len(winner_ids))
+            winners = {
+                row[0]: row
+                for row in self._conn.execute(f"""
+                    SELECT id, hash, message, files_changed, semantic_changes
+                    FROM commits WHERE id IN ({placeholders})
+                """, winner_ids)
+            }
+
+            results = []
+            for idx in top:
+                row = winners[row_ids[idx]]
+                results.append(CommitHit(
+                    row[1],
+                    row[2],
+                    orjson.loads(row[3]),
+                    orjson.loads(row[4]),
+                    float(sims[idx]),
+                ))
+
+            return results
+
         except Exception as e:
-            logger.error(f"Failed to find similar commits: {e}")
+            logger.error("Failed to find similar commits: %s", e)
+            return []
+
+    @staticmethod
+    def _fts_candidates(conn, query: str) -> List[int]:
+        """Look up commit ids whose text matches the query keywords"""
+        tokens = _FTS_TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+
+        match_expr = " OR ".join(f'"{token}"' for token in dict.fromkeys(tokens))
+        try:
+            cursor = conn.execute(
+                "SELECT rowid FROM commits_fts WHERE commits_fts MATCH ? LIMIT ?",
+                (match_expr, _FTS_CANDIDATES),
+            )
+            return [row[0] for row in cursor]
+        except sqlite3.OperationalError as e:
+            logger.debug("FTS lookup failed, using full scan: %s", e)
             return []
 
     def get_file_context(self, filepath: str) -> Optional[Dict]:
         """Get stored context for a file"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT functions, classes, last_updated
-                    FROM file_context WHERE filepath = ?
-                """, (filepath,))
-                
-                row = cursor.fetchone()
-                if row:
-                    return {
-                        'functions': json.loads(row[0]),
-                        'classes': json.loads(row[1]),
-                        'last_updated': row[2]
-                    }
-                    
+            cursor = self._conn.execute("""
+                SELECT functions, classes, last_updated
+                FROM file_context WHERE filepath = ?
+            """, (filepath,))
+
+            row = cursor.fetchone()
+            if row:
+                return {
+                    'functions': orjson.loads(row[0]),
+                    'classes': orjson.loads(row[1]),
+                    'last_updated': row[2]
+                }
+
+
         except Exception as e:
-            logger.error(f"Failed to get file context for {filepath}: {e}")
+            logger.error("Failed to get file context for %s: %s", filepath, e)
             
         return None
 
@@ -164,38 +443,39 @@ class GitgeistMemory:
         """Store file context information"""
         try:
             # Create embedding from file structure
-            text = f"File: {filepath} | Functions: {', '.join(functions[:10])} | Classes: {', '.join(classes[:5])}"
-            embedding = self.model.encode(text)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO file_context
-                    (filepath, functions, classes, embedding, last_updated)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    filepath,
-                    json.dumps(functions),
-                    json.dumps(classes),
-                    embedding.tobytes(),
-                    __import__('time').time()
-                ))
-                
+            text = f"File: {filepath} | Functions: {', '.join(islice(functions, 10))} | Classes: {', '.join(islice(classes, 5))}"
+            embedding = self._embed(text)
+
+            self._conn.execute("""
+                INSERT OR REPLACE INTO file_context
+                (filepath, functions, classes, embedding, last_updated)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                filepath,
+                orjson.dumps(functions).decode(),
+                orjson.dumps(classes).decode(),
+                _quantize(embedding),
+                time.time()
+            ))
+
+
         except Exception as e:
-            logger.error(f"Failed to store file context for {filepath}: {e}")
+            logger.error("Failed to store file context for %s: %s", filepath, e)
 
     def get_memory_stats(self) -> Dict:
         """Get memory database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                commits_count = conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
-                files_count = conn.execute("SELECT COUNT(*) FROM file_context").fetchone()[0]
-                
-                return {
-                    'commits_stored': commits_count,
-                    'files_tracked': files_count,
-                    'db_size_mb': self.db_path.stat().st_size / (1024 * 1024) if self.db_path.exists() else 0
-                }
-                
+            self.flush()
+            commits_count = self._conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0]
+            files_count = self._conn.execute("SELECT COUNT(*) FROM file_context").fetchone()[0]
+
+            return {
+                'commits_stored': commits_count,
+                'files_tracked': files_count,
+                'db_size_mb': self.db_path.stat().st_size / (1024 * 1024) if self.db_path.exists() else 0
+            }
+
+
         except Exception as e:
-            logger.error(f"Failed to get memory stats: {e}")
+            logger.error("Failed to get memory stats: %s", e)
             return {'commits_stored': 0, 'files_tracked': 0, 'db_size_mb': 0}
\ No newline at end of file
@@ -43,7 +43,7 @@ class ErrorHandler:
             console.print("\n[dim]Full traceback:[/dim]")
             console.print(traceback.format_exc(), style="dim")
         
-        logger.error(f"{context}: {error}", exc_info=True)
+        logger.error("%s: %s", context, error, exc_info=True)
 
     @staticmethod
     def safe_execute(func: Callable, *args, context: str = "", **kwargs) -> Optional[Any]:
@@ -1,9 +1,11 @@
 # gitgeist/utils/recovery.py
-import json
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
+
 from gitgeist.core.config import GitgeistConfig
 from gitgeist.utils.exceptions import GitgeistError
 from gitgeist.utils.logger import get_logger
@@ -26,7 +28,7 @@ class RecoveryManager:
                 logger.info("Configuration backup created")
                 return True
         except Exception as e:
-            logger.error(f"Failed to create backup: {e}")
+            logger.error("Failed to create backup: %s", e)
         return False
 
     def restore_backup(self) -> bool:
@@ -37,7 +39,7 @@ class RecoveryManager:
                 logger.info("Configuration restored from backup")
                 return True
         except Exception as e:
-            logger.error(f"Failed to restore backup: {e}")
+            logger.error("Failed to restore backup: %s", e)
         return False
 
     def repair_config(self) -> Optional[GitgeistConfig]:
@@ -45,21 +47,21 @@ class RecoveryManager:
         try:
             # Try to load existing config
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                
+                data = orjson.loads(self.config_path.read_bytes())
+
                 # Fix common issues
                 repaired_data = self._repair_config_data(data)
-                
+
                 # Save repaired config
-                with open(self.config_path, 'w') as f:
-                    json.dump(repaired_data, f, indent=2)
-                
+                self.config_path.write_bytes(
+                    orjson.dumps(repaired_data, option=orjson.OPT_INDENT_2)
+                )
+
                 logger.info("Configuration repaired")
                 return GitgeistConfig.load()
                 
         except Exception as e:
-            logger.error(f"Config repair failed: {e}")
+            logger.error("Config repair failed: %s", e)
             
             # Try backup restore
             if self.restore_backup():
@@ -93,7 +95,7 @@ class RecoveryManager:
         for key, default_value in defaults.items():
             if key not in data:
                 data[key] = default_value
-                logger.debug(f"Added missing config key: {key}")
+                logger.debug("Added missing config key: %s", key)
         
         # Fix invalid values
         if not isinstance(data.get("temperature"), (int, float)):
@@ -123,15 +125,23 @@ class RecoveryManager:
                 if logs_dir.exists():
                     import time
                     week_ago = time.time() - (7 * 24 * 60 * 60)
-                    
-                    for log_file in logs_dir.glob("*.log"):
-                        if log_file.stat().st_mtime < week_ago:
-                            log_file.unlink()
-                            logger.debug(f"Removed old log: {log_file}")
+
+                    # scandir hands back entries with a cached stat, so
+                    # this is one syscall per file instead of glob's
+                    # pattern machinery plus a stat per Path
+                    with os.scandir(logs_dir) as entries:
+                        for entry in entries:
+                            if (
+                                entry.name.endswith(".log")
+                                and entry.is_file(follow_symlinks=False)
+                                and entry.stat().st_mtime < week_ago
+                            ):
+                                os.unlink(entry.path)
+                                logger.debug("Removed old log: %s", entry.path)
                 
                 return True
         except Exception as e:
-            logger.error(f"Failed to clean data directory: {e}")
+            logger.error("Failed to clean data directory: %s", e)
         
         return False
 
@@ -153,7 +163,7 @@ class RecoveryManager:
             return config
             
         except Exception as e:
-            logger.error(f"Failed to reset config: {e}")
+            logger.error("Failed to reset config: %s", e)
             raise GitgeistError(f"Could not reset configuration: {e}")
 
     def diagnose_system(self) -> Dict[str, bool]:
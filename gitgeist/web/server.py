@@ -1,4 +1,5 @@
 # gitgeist/web/server.py
+import functools
 import json
 from pathlib import Path
 from typing import Dict, List
@@ -10,6 +11,24 @@ from gitgeist.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@functools.lru_cache(maxsize=4)
+def _get_memory(data_dir: str) -> GitgeistMemory:
+    """One GitgeistMemory per data dir; handlers hit this every request"""
+    return GitgeistMemory(Path(data_dir))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_workspace() -> WorkspaceManager:
+    """Shared workspace manager; it stat-caches workspace.json itself"""
+    return WorkspaceManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config() -> GitgeistConfig:
+    """Load the config once for the lifetime of the server process"""
+    return GitgeistConfig.load()
+
 try:
     from fastapi import FastAPI, HTTPException
     from fastapi.responses import HTMLResponse
@@ -87,11 +106,9 @@ if FASTAPI_AVAILABLE:
     async def get_metrics() -> Dict:
         """Get system metrics"""
         try:
-            workspace = WorkspaceManager()
-            repositories = workspace.list_repositories()
-            
-            config = GitgeistConfig.load()
-            memory = GitgeistMemory(config.data_dir)
+            repositories = _get_workspace().list_repositories()
+
+            memory = _get_memory(str(_get_config().data_dir))
             memory_stats = memory.get_memory_stats()
             
             return {
@@ -0,0 +1,10 @@
+# tests/conftest.py
+import pytest
+
+from gitgeist.analysis.ast_parser import GitgeistASTParser
+
+
+@pytest.fixture(scope="session")
+def ast_parser():
+    """One parser per test session; grammar loading is paid once"""
+    return GitgeistASTParser()
@@ -1,12 +1,9 @@
 # tests/test_ast_parser.py
-import pytest
 
-from gitgeist.analysis.ast_parser import GitgeistASTParser
 
-
-def test_language_detection():
+def test_language_detection(ast_parser):
     """Test programming language detection from file extensions"""
-    parser = GitgeistASTParser()
+    parser = ast_parser
 
     assert parser.detect_language("test.py") == "python"
     assert parser.detect_language("test.js") == "javascript"
@@ -16,9 +13,9 @@ def test_language_detection():
     assert parser.detect_language("test.txt") is None
 
 
-def test_python_function_extraction():
+def test_python_function_extraction(ast_parser):
     """Test Python function extraction from AST"""
-    parser = GitgeistASTParser()
+    parser = ast_parser
 
     python_code = """
 def hello_world():
@@ -42,9 +39,9 @@ class TestClass:
         assert "method" in function_names
 
 
-def test_javascript_function_extraction():
+def test_javascript_function_extraction(ast_parser):
     """Test JavaScript function extraction from AST"""
-    parser = GitgeistASTParser()
+    parser = ast_parser
 
     js_code = """
 function regularFunction() {
@@ -72,9 +69,9 @@ class MyClass {
         assert "regularFunction" in function_names
 
 
-def test_semantic_diff():
+def test_semantic_diff(ast_parser):
     """Test semantic diff between code versions"""
-    parser = GitgeistASTParser()
+    parser = ast_parser
 
     old_code = """
 def old_function():
@@ -95,3 +95,23 @@ def test_config_save_load():
         loaded_config = GitgeistConfig.load(config_path)
         assert loaded_config.llm_model == "test_model"
         assert loaded_config.temperature == 0.7
+
+
+def test_config_load_cached():
+    """Test repeated loads reuse the cached config until the file changes"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = Path(temp_dir) / "test_config.json"
+
+        config = GitgeistConfig(llm_model="cached_model")
+        config.save(config_path)
+
+        first = GitgeistConfig.load(config_path)
+        second = GitgeistConfig.load(config_path)
+        assert first is second
+
+        # Rewriting the file invalidates the cached entry
+        updated = GitgeistConfig(llm_model="updated_model")
+        updated.save(config_path)
+
+        reloaded = GitgeistConfig.load(config_path)
+        assert reloaded.llm_model == "updated_model"